@@ -4,7 +4,7 @@ Standalone daemon that monitors trading bots via WebSocket and sends
 status updates to Telegram.
 
 Usage:
-    python main.py configs/production.yaml
+    python main.py configs/production.yaml [--log-level DEBUG]
 """
 
 from __future__ import annotations
@@ -23,6 +23,9 @@ from src.telegram_bot import TelegramBot
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on how long shutdown waits for the monitor to unwind
+SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
 
 async def main() -> None:
     parser = argparse.ArgumentParser(
@@ -32,6 +35,12 @@ async def main() -> None:
         "config_file",
         help="Path to the YAML configuration file",
     )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level",
+    )
     args = parser.parse_args()
 
     # Load .env file (if present) so TELEGRAM_BOT_TOKEN etc. are in os.environ
@@ -39,7 +48,7 @@ async def main() -> None:
 
     # Load config
     config = load_config(args.config_file)
-    configure_logging("INFO")
+    configure_logging(args.log_level)
 
     logger.info(
         "Starting bot-telegram-daemon with %d bot(s)...", len(config.bots)
@@ -59,27 +68,62 @@ async def main() -> None:
         stop_event.set()
 
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, _signal_handler)
+        try:
+            loop.add_signal_handler(sig, _signal_handler)
+        except NotImplementedError:
+            # Windows event loops lack add_signal_handler
+            signal.signal(
+                sig, lambda *_: loop.call_soon_threadsafe(_signal_handler)
+            )
+
+    # SIGHUP reloads the bot list from the config file without a restart
+    reload_event = asyncio.Event()
+
+    def _reload_handler() -> None:
+        logger.info("Reload signal received...")
+        reload_event.set()
+
+    if hasattr(signal, "SIGHUP"):
+        try:
+            loop.add_signal_handler(signal.SIGHUP, _reload_handler)
+        except NotImplementedError:
+            pass
+
+    async def _reload_loop() -> None:
+        while True:
+            await reload_event.wait()
+            reload_event.clear()
+            try:
+                new_config = load_config(args.config_file)
+            except Exception as e:
+                logger.error("Config reload failed, keeping current bots: %s", e)
+                continue
+            await monitor.reload_bots(new_config.bots)
 
     # Start Telegram bot
     await telegram_bot.start()
 
     # Start monitor (runs WebSocket clients + periodic reporter)
     monitor_task = asyncio.create_task(monitor.run())
+    reload_task = asyncio.create_task(_reload_loop())
 
     # Wait for shutdown signal
     await stop_event.wait()
 
-    # Graceful shutdown
+    # Graceful shutdown — every join below is bounded by the timeout
     logger.info("Shutting down...")
-    await monitor.stop()
-
-    # Give monitor tasks a moment to clean up
-    monitor_task.cancel()
-    try:
-        await monitor_task
-    except asyncio.CancelledError:
-        pass
+    reload_task.cancel()
+    await monitor.stop(timeout=SHUTDOWN_TIMEOUT_SECONDS)
+    monitor_task.cancel()  # no-op once run() has returned
+    _, pending = await asyncio.wait(
+        [monitor_task, reload_task], timeout=SHUTDOWN_TIMEOUT_SECONDS
+    )
+    if pending:
+        logger.warning(
+            "Tasks did not stop within %gs, abandoning: %s",
+            SHUTDOWN_TIMEOUT_SECONDS,
+            ", ".join(sorted(task.get_name() for task in pending)),
+        )
 
     await telegram_bot.stop()
     logger.info("Daemon stopped.")
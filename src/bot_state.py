@@ -2,17 +2,27 @@
 
 Each monitored bot has a BotState instance that tracks its connection status,
 latest configuration, system info, and most recent summary.
+
+Lifecycle: ``generated`` (configured, no data yet) -> ``activated`` (emitting
+summaries) -> ``merged`` (summary unchanged across a report tick) ->
+``archived`` (silent longer than the archive TTL; skipped from periodic
+reports). Any new summary moves a bot back to ``activated``.
 """
 
 from __future__ import annotations
 
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Callable, Literal
 
 from .models import PerpGridSummary, SpotGridSummary, StrategyConfig, SystemInfo
 
+BotLifecycle = Literal["generated", "activated", "merged", "archived"]
+
 
-@dataclass
+@dataclass(slots=True)
 class BotState:
     """Mutable state container for a single monitored bot."""
 
@@ -21,20 +31,66 @@ class BotState:
 
     # Connection status
     connected: bool = False
-    last_connected_at: datetime | None = None
+    # Timestamps are time.monotonic() values; see the *_iso properties
+    last_connected_at: float | None = None
+    lifecycle: BotLifecycle = "generated"
 
     # Cached data from WS events
     info: SystemInfo | None = None
     config: StrategyConfig | None = None
     summary: SpotGridSummary | PerpGridSummary | None = None
-    last_summary_at: datetime | None = None
+    last_summary_at: float | None = None
 
     # Error tracking
     last_error: str | None = None
-    last_error_at: datetime | None = None
+    last_error_at: float | None = None
 
-    # Periodic tracking — snapshots at last report, for computing deltas
-    prev_roundtrips: int = 0
-    prev_matched_profit: float = 0.0
-    prev_total_fees: float = 0.0
+    # Periodic tracking — (roundtrips, matched_profit, total_fees) at last
+    # report, for computing deltas
+    prev_snapshot: tuple[int, float, float] = (0, 0.0, 0.0)
     initial_summary_sent: bool = False
+
+    # Periodic text template with the per-bot constant parts pre-rendered;
+    # rebuilt by the formatter whenever report_template_key changes
+    report_template: Callable[..., str] | None = field(default=None, repr=False)
+    report_template_key: tuple | None = None
+
+    def __post_init__(self) -> None:
+        # label/url never change; interned so every dict keyed by label
+        # (monitor, cooldowns, dirty set) shares one string object
+        self.label = sys.intern(self.label)
+        self.url = sys.intern(self.url)
+
+    def period_deltas(self) -> tuple[int, float, float]:
+        """Return (new trades, matched profit, fees) since the last snapshot.
+
+        Requires ``summary`` to be set.
+        """
+        assert self.summary is not None
+        s = self.summary
+        prev_trades, prev_matched, prev_fees = self.prev_snapshot
+        return (
+            s.roundtrips - prev_trades,
+            s.matched_profit - prev_matched,
+            s.total_fees - prev_fees,
+        )
+
+    @property
+    def last_connected_at_iso(self) -> str | None:
+        return _monotonic_to_iso(self.last_connected_at)
+
+    @property
+    def last_summary_at_iso(self) -> str | None:
+        return _monotonic_to_iso(self.last_summary_at)
+
+    @property
+    def last_error_at_iso(self) -> str | None:
+        return _monotonic_to_iso(self.last_error_at)
+
+
+def _monotonic_to_iso(ts: float | None) -> str | None:
+    """Convert a time.monotonic() stamp to local wall-clock ISO time."""
+    if ts is None:
+        return None
+    wall = datetime.now() - timedelta(seconds=time.monotonic() - ts)
+    return wall.isoformat(timespec="seconds")
@@ -7,16 +7,22 @@ Provides two card styles:
 
 from __future__ import annotations
 
+import copy
+import functools
 import io
 import logging
-from datetime import datetime
-from typing import TYPE_CHECKING
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import astuple, dataclass
+from typing import TYPE_CHECKING, Callable
 
 from PIL import Image, ImageDraw, ImageFont
 
+from .models import PerpGridSummary, SpotGridSummary
+
 if TYPE_CHECKING:
     from .bot_state import BotState
-    from .models import PerpGridSummary, SpotGridSummary
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +69,19 @@ L_ACCENT_BG = (239, 246, 255)   # blue-50 tint
 _LS_W = 780
 _LS_PAD = 40
 
+# Status card row heights (each row except the footer ends in a 1px divider)
+_LS_ACCENT_H = 4
+_LS_HEADER_H = 64
+_LS_SYMBOL_H = 60
+_LS_PNL_H = 150
+_LS_METRIC_H = 96
+_LS_MODE_H = 36
+_LS_FOOTER_H = 52
+
+# Metric row columns: left edges and centres, keyed by cell count
+_LS_COL_EDGES = {n: tuple(i * (_LS_W // n) for i in range(n)) for n in (2, 3)}
+_LS_COL_CENTERS = {n: tuple(x + _LS_W // n // 2 for x in edges) for n, edges in _LS_COL_EDGES.items()}
+
 # ---------------------------------------------------------------------------
 # Font management
 # ---------------------------------------------------------------------------
@@ -73,14 +92,46 @@ _DEJAVU_DIR = "/usr/share/fonts/truetype/dejavu/"
 _MAC_SUPP_DIR = "/System/Library/Fonts/Supplemental/"
 _MAC_SYS_DIR  = "/System/Library/Fonts/"
 
+_BOLD_PATHS = (
+    _UBUNTU_DIR + "Ubuntu-B.ttf", _DEJAVU_DIR + "DejaVuSans-Bold.ttf",
+    _MAC_SUPP_DIR + "Arial Bold.ttf", _MAC_SYS_DIR + "Helvetica.ttc",
+)
+_REG_PATHS = (
+    _UBUNTU_DIR + "Ubuntu-R.ttf", _DEJAVU_DIR + "DejaVuSans.ttf",
+    _MAC_SUPP_DIR + "Arial.ttf", _MAC_SYS_DIR + "Helvetica.ttc",
+)
+_MONO_PATHS = (
+    _UBUNTU_DIR + "UbuntuMono-R.ttf", _DEJAVU_DIR + "DejaVuSansMono.ttf",
+    _MAC_SUPP_DIR + "Courier New.ttf",
+)
+
+# Font file contents by path (None = missing/unreadable), read once per process
+_FONT_FILE_CACHE: dict[str, bytes | None] = {}
+
+
+def _font_bytes(path: str) -> bytes | None:
+    if path not in _FONT_FILE_CACHE:
+        try:
+            with open(path, "rb") as fh:
+                _FONT_FILE_CACHE[path] = fh.read()
+        except OSError:
+            _FONT_FILE_CACHE[path] = None
+    return _FONT_FILE_CACHE[path]
+
+
 def _try_font(path: str, size: int) -> ImageFont.FreeTypeFont | None:
+    data = _font_bytes(path)
+    if data is None:
+        return None
     try:
-        return ImageFont.truetype(path, size)
+        return ImageFont.truetype(io.BytesIO(data), size)
     except (OSError, IOError):
         return None
 
 
-def _load_any(paths: list[str], size: int) -> ImageFont.FreeTypeFont:
+@functools.lru_cache(maxsize=None)
+def _load_any(paths: tuple[str, ...], size: int) -> ImageFont.FreeTypeFont:
+    """First loadable font from paths at size; one instance per (paths, size)."""
     for path in paths:
         f = _try_font(path, size)
         if f is not None:
@@ -88,56 +139,66 @@ def _load_any(paths: list[str], size: int) -> ImageFont.FreeTypeFont:
     return ImageFont.load_default()
 
 
-_STATUS_FONT_CACHE: dict | None = None
-
-
+@functools.lru_cache(maxsize=1)
 def _status_fonts() -> dict:
     """Font cache for 780px-wide status card."""
-    global _STATUS_FONT_CACHE
-    if _STATUS_FONT_CACHE:
-        return _STATUS_FONT_CACHE
-
-    bold_paths = [
-        _UBUNTU_DIR + "Ubuntu-B.ttf", _DEJAVU_DIR + "DejaVuSans-Bold.ttf",
-        _MAC_SUPP_DIR + "Arial Bold.ttf", _MAC_SYS_DIR + "Helvetica.ttc",
-    ]
-    reg_paths = [
-        _UBUNTU_DIR + "Ubuntu-R.ttf", _DEJAVU_DIR + "DejaVuSans.ttf",
-        _MAC_SUPP_DIR + "Arial.ttf", _MAC_SYS_DIR + "Helvetica.ttc",
-    ]
-    mono_paths = [
-        _UBUNTU_DIR + "UbuntuMono-R.ttf", _DEJAVU_DIR + "DejaVuSansMono.ttf",
-        _MAC_SUPP_DIR + "Courier New.ttf",
-    ]
-
-    _STATUS_FONT_CACHE = {
-        "b14": _load_any(bold_paths, 14),
-        "b16": _load_any(bold_paths, 16),
-        "b20": _load_any(bold_paths, 20),
-        "b28": _load_any(bold_paths, 28),
-        "b48": _load_any(bold_paths, 48),
-        "r14": _load_any(reg_paths,  14),
-        "r16": _load_any(reg_paths,  16),
-        "mn14": _load_any(mono_paths, 14),
+    return {
+        "b14": _load_any(_BOLD_PATHS, 14),
+        "b16": _load_any(_BOLD_PATHS, 16),
+        "b20": _load_any(_BOLD_PATHS, 20),
+        "b28": _load_any(_BOLD_PATHS, 28),
+        "b48": _load_any(_BOLD_PATHS, 48),
+        "r14": _load_any(_REG_PATHS,  14),
+        "r16": _load_any(_REG_PATHS,  16),
+        "mn14": _load_any(_MONO_PATHS, 14),
     }
-    return _STATUS_FONT_CACHE
 
 
 # ---------------------------------------------------------------------------
 # Low-level drawing helpers
 # ---------------------------------------------------------------------------
 
-def _textsize(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int, int, int]:
+@functools.lru_cache(maxsize=4096)
+def _bbox(text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int, int, int]:
+    """Memoized font.getbbox — labels and common values repeat across cards."""
+    return font.getbbox(text)
+
+
+def _textsize(text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int, int, int]:
     """Return textbbox (left, top, right, bottom)."""
-    return draw.textbbox((0, 0), text, font=font)
+    return _bbox(text, font)
 
 
-def _tw(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont) -> int:
+def _tw(text: str, font: ImageFont.FreeTypeFont) -> int:
     """Text pixel width."""
-    bb = _textsize(draw, text, font)
+    bb = _textsize(text, font)
     return bb[2] - bb[0]
 
 
+@functools.lru_cache(maxsize=1024)
+def _rasterize(text: str, font: ImageFont.FreeTypeFont):
+    """Render text to an L-mode mask sized to its tight bbox — one FreeType pass.
+
+    Masks are colour-independent, so labels, symbols, badges and unchanged
+    values are rasterized once and re-blitted in any colour.
+    """
+    if isinstance(font, ImageFont.FreeTypeFont):
+        return font.getmask2(text, "L")[0]
+    return font.getmask(text, "L")
+
+
+def _blit(draw: ImageDraw.ImageDraw, x: int, y: int, mask, fill: tuple) -> None:
+    """Paint fill through mask with its top-left at (x, y)."""
+    w, h = mask.size
+    if w and h:
+        draw.im.paste(fill, (x, y, x + w, y + h), mask)
+
+
+def _fill_rect(draw: ImageDraw.ImageDraw, box: tuple[int, int, int, int], fill: tuple) -> None:
+    """Solid fill of box (x0, y0, x1, y1), end-exclusive, straight into the core image."""
+    draw.im.paste(fill, box)
+
+
 def _text(
     draw: ImageDraw.ImageDraw,
     x: int,
@@ -146,9 +207,8 @@ def _text(
     font: ImageFont.FreeTypeFont,
     fill: tuple,
 ) -> None:
-    """Draw text at (x, y) with bbox-offset correction so (x,y) is true top-left."""
-    bb = _textsize(draw, text, font)
-    draw.text((x - bb[0], y - bb[1]), text, font=font, fill=fill)
+    """Draw text with its ink bbox's top-left at (x, y)."""
+    _blit(draw, x, y, _rasterize(text, font), fill)
 
 
 def _text_centered(
@@ -160,9 +220,8 @@ def _text_centered(
     fill: tuple,
 ) -> None:
     """Draw text horizontally centered around cx, top at y."""
-    bb = _textsize(draw, text, font)
-    x = cx - (bb[2] - bb[0]) // 2
-    _text(draw, x, y, text, font, fill)
+    mask = _rasterize(text, font)
+    _blit(draw, cx - mask.size[0] // 2, y, mask, fill)
 
 
 def _text_right(
@@ -174,9 +233,8 @@ def _text_right(
     fill: tuple,
 ) -> None:
     """Draw text right-aligned at rx, top at y."""
-    bb = _textsize(draw, text, font)
-    x = rx - (bb[2] - bb[0])
-    _text(draw, x, y, text, font, fill)
+    mask = _rasterize(text, font)
+    _blit(draw, rx - mask.size[0], y, mask, fill)
 
 
 def _text_vcenter(
@@ -189,10 +247,8 @@ def _text_vcenter(
     fill: tuple,
 ) -> None:
     """Draw text left-aligned at x, vertically centered in section."""
-    bb = _textsize(draw, text, font)
-    h = bb[3] - bb[1]
-    y = sec_y + (sec_h - h) // 2
-    _text(draw, x, y, text, font, fill)
+    mask = _rasterize(text, font)
+    _blit(draw, x, sec_y + (sec_h - mask.size[1]) // 2, mask, fill)
 
 
 def _text_vcenter_right(
@@ -205,12 +261,51 @@ def _text_vcenter_right(
     fill: tuple,
 ) -> None:
     """Draw text right-aligned at rx, vertically centered in section."""
-    bb = _textsize(draw, text, font)
-    w = bb[2] - bb[0]
-    h = bb[3] - bb[1]
-    x = rx - w
-    y = sec_y + (sec_h - h) // 2
-    _text(draw, x, y, text, font, fill)
+    mask = _rasterize(text, font)
+    w, h = mask.size
+    _blit(draw, rx - w, sec_y + (sec_h - h) // 2, mask, fill)
+
+
+@functools.lru_cache(maxsize=1024)
+def _glyph(char: str, font: ImageFont.FreeTypeFont) -> tuple[Image.Image | None, tuple[int, int], float]:
+    """Rasterized glyph mask, its offset and advance — the hero-number atlas."""
+    mask, offset = font.getmask2(char, "L")
+    tile = Image.frombytes("L", mask.size, bytes(mask)) if mask.size[0] else None
+    return tile, offset, font.getlength(char)
+
+
+def _text_glyphs(
+    img: Image.Image,
+    x: int,
+    y: int,
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    fill: tuple,
+) -> None:
+    """Like _text, but composites cached glyph masks instead of re-rasterizing.
+
+    Meant for hero numbers and monospace readouts. Falls back to _text when
+    kerning or fractional advances would make per-glyph placement inexact.
+    """
+    glyphs = [_glyph(c, font) for c in text] if isinstance(font, ImageFont.FreeTypeFont) else []
+    if not glyphs or sum(g[2] for g in glyphs) != font.getlength(text) or any(g[2] % 1 for g in glyphs):
+        _text(ImageDraw.Draw(img), x, y, text, font, fill)
+        return
+
+    bb = _bbox(text, font)
+    gx, gy = x - bb[0], y - bb[1]
+    for tile, (ox, oy), advance in glyphs:
+        if tile is not None:
+            img.paste(fill, (gx + ox, gy + oy), tile)
+        gx += int(advance)
+
+
+@functools.lru_cache(maxsize=64)
+def _pill_mask(w: int, h: int):
+    """Coverage mask for a radius-4 pill spanning (0, 0)-(w, h) inclusive."""
+    mask = Image.new("L", (w + 1, h + 1), 0)
+    ImageDraw.Draw(mask).rounded_rectangle([(0, 0), (w, h)], radius=4, fill=255)
+    return mask.im
 
 
 def _badge(
@@ -225,16 +320,12 @@ def _badge(
     v_pad: int = 4,
 ) -> int:
     """Draw a rounded pill badge. Returns right edge x."""
-    bb = _textsize(draw, text, font)
-    tw = bb[2] - bb[0]
-    th = bb[3] - bb[1]
+    mask = _rasterize(text, font)
+    tw, th = mask.size
     w = tw + 2 * h_pad
     h = th + 2 * v_pad
-    draw.rounded_rectangle([(x, y), (x + w, y + h)], radius=4, fill=bg_color)
-    # Text inside badge with offset correction
-    tx = x + h_pad - bb[0]
-    ty = y + v_pad - bb[1]
-    draw.text((tx, ty), text, font=font, fill=text_color)
+    _blit(draw, x, y, _pill_mask(w, h), bg_color)
+    _blit(draw, x + h_pad, y + v_pad, mask, text_color)
     return x + w
 
 
@@ -242,14 +333,12 @@ def _badge(
 # Price / value formatting
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1024)
 def _fp(price: float) -> str:
     """Format price with thousands separator and smart decimals."""
     if price >= 1000.0:
-        whole = int(price)
-        frac = round((price - whole) * 100)
-        if frac > 0:
-            return f"{whole:,}.{frac:02d}"
-        return f"{whole:,}"
+        s = f"{price:,.2f}"
+        return s[:-3] if s.endswith(".00") else s
     elif price >= 1.0:
         return f"{price:.2f}"
     elif price >= 0.01:
@@ -258,21 +347,134 @@ def _fp(price: float) -> str:
         return f"{price:.2f}"
 
 
+@functools.lru_cache(maxsize=1024)
 def _signed(value: float) -> str:
     """Format value as +$X.XX or -$X.XX."""
     sign = "+" if value >= 0 else "-"
     return f"{sign}${_fp(abs(value))}"
 
 
+@functools.lru_cache(maxsize=64)
 def _format_spacing(spacing: tuple[float, float]) -> str:
     min_s, max_s = spacing
     decimals = 3 if min_s < 1.0 else 2
-    diff_ratio = abs(max_s - min_s) / max(max_s, min_s) if max(max_s, min_s) > 0 else 0
-    if diff_ratio < 0.01:
+    hi = max(max_s, min_s)
+    # Within 1% of each other counts as a single geometric spacing.
+    if hi <= 0 or abs(max_s - min_s) * 100.0 < hi:
         return f"{min_s:.{decimals}f}%"
     return f"{min_s:.{decimals}f}%–{max_s:.{decimals}f}%"
 
 
+# ---------------------------------------------------------------------------
+# Card clock
+# ---------------------------------------------------------------------------
+
+# Cards only show the minute, so the labels are formatted once per minute.
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_clock_minute: int | None = None
+_clock_labels: tuple[str, str, str] = ("", "", "")
+
+
+def _clock() -> tuple[str, str, str]:
+    """Current ("HH:MM", "Mon DD", "HH:MM  Mon DD") labels for card timestamps.
+
+    Builders read this once per card and pass the labels down, so every
+    section and the render-cache key agree on the same minute.
+    """
+    global _clock_minute, _clock_labels
+    now = time.time()
+    minute = int(now // 60)
+    if minute != _clock_minute:
+        t = time.localtime(now)
+        hm = f"{t.tm_hour:02d}:{t.tm_min:02d}"
+        md = f"{_MONTHS[t.tm_mon - 1]} {t.tm_mday:02d}"
+        # Labels first: a reader that sees the new minute sees the new labels.
+        _clock_labels = (hm, md, f"{hm}  {md}")
+        _clock_minute = minute
+    return _clock_labels
+
+
+# ---------------------------------------------------------------------------
+# PNG encoding
+# ---------------------------------------------------------------------------
+
+# zlib level 1 encodes ~6× faster than optimize=True for ~25% more bytes —
+# a few KB on a Telegram upload.
+_PNG_COMPRESS_LEVEL = 1
+
+
+def _encode_png(img: Image.Image) -> io.BytesIO:
+    """Encode img as PNG into a BytesIO seeked to 0."""
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=_PNG_COMPRESS_LEVEL)
+    buf.seek(0)
+    return buf
+
+
+# Recently encoded cards keyed by every render input plus the minute shown on
+# the card, so a repeated /status or an unchanged periodic tick skips rendering.
+# Cards are rendered in worker threads, hence the lock.
+_CARD_CACHE: OrderedDict[tuple, bytes] = OrderedDict()
+_CARD_CACHE_SIZE = 32
+_CARD_CACHE_LOCK = threading.Lock()
+
+
+def _cached_card(key: tuple) -> io.BytesIO | None:
+    with _CARD_CACHE_LOCK:
+        data = _CARD_CACHE.get(key)
+        if data is None:
+            return None
+        _CARD_CACHE.move_to_end(key)
+    return io.BytesIO(data)
+
+
+def _store_card(key: tuple, img: Image.Image) -> io.BytesIO:
+    buf = _encode_png(img)
+    with _CARD_CACHE_LOCK:
+        _CARD_CACHE[key] = buf.getvalue()
+        if len(_CARD_CACHE) > _CARD_CACHE_SIZE:
+            _CARD_CACHE.popitem(last=False)
+    return buf
+
+
+# ---------------------------------------------------------------------------
+# Card inputs
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class CardSnapshot:
+    """Everything a card reads from a BotState, captured at one instant.
+
+    The event loop keeps replacing BotState attributes as WS events arrive,
+    so callers rendering in a worker thread take this snapshot on the loop
+    thread first; the render and its cache key then see the same values.
+    """
+
+    summary: SpotGridSummary | PerpGridSummary | None
+    exchange: str
+    network: str
+    trigger: float | None
+    investment: float
+    is_isolated: bool
+    prev_snapshot: tuple[int, float, float]
+
+
+def card_snapshot(state: "BotState") -> CardSnapshot:
+    """Capture the card inputs of state; call on the thread that owns it."""
+    summary = copy.copy(state.summary)
+    info = state.info
+    config = state.config
+    return CardSnapshot(
+        summary=summary,
+        exchange=info.exchange if info else "unknown",
+        network=info.network if info else "unknown",
+        trigger=config.trigger_price if config else None,
+        investment=config.total_investment if config else 0.0,
+        is_isolated=config.is_isolated if config else False,
+        prev_snapshot=state.prev_snapshot,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Compact periodic card — Binance PnL-share style, dark theme
 # ---------------------------------------------------------------------------
@@ -295,32 +497,75 @@ def _lp_color(value: float) -> tuple:
     return _P_GREEN if value >= 0 else _P_RED
 
 
-_PERIODIC_FONT_CACHE: dict | None = None
-
-
+@functools.lru_cache(maxsize=1)
 def _periodic_fonts() -> dict:
-    global _PERIODIC_FONT_CACHE
-    if _PERIODIC_FONT_CACHE:
-        return _PERIODIC_FONT_CACHE
-
-    bold_paths = [
-        _UBUNTU_DIR + "Ubuntu-B.ttf", _DEJAVU_DIR + "DejaVuSans-Bold.ttf",
-        _MAC_SUPP_DIR + "Arial Bold.ttf", _MAC_SYS_DIR + "Helvetica.ttc",
-    ]
-    reg_paths = [
-        _UBUNTU_DIR + "Ubuntu-R.ttf", _DEJAVU_DIR + "DejaVuSans.ttf",
-        _MAC_SUPP_DIR + "Arial.ttf", _MAC_SYS_DIR + "Helvetica.ttc",
-    ]
-
-    _PERIODIC_FONT_CACHE = {
-        "hero":  _load_any(bold_paths, 60),
-        "b34":   _load_any(bold_paths, 34),
-        "b28":   _load_any(bold_paths, 28),
-        "b20":   _load_any(bold_paths, 20),
-        "r18":   _load_any(reg_paths,  18),
-        "r16":   _load_any(reg_paths,  16),
+    """Font cache for the 540px periodic card."""
+    return {
+        "hero":  _load_any(_BOLD_PATHS, 60),
+        "b34":   _load_any(_BOLD_PATHS, 34),
+        "b28":   _load_any(_BOLD_PATHS, 28),
+        "b20":   _load_any(_BOLD_PATHS, 20),
+        "r18":   _load_any(_REG_PATHS,  18),
+        "r16":   _load_any(_REG_PATHS,  16),
     }
-    return _PERIODIC_FONT_CACHE
+
+
+# Fixed periodic layout positions
+_PC_PAD = 34
+_PC_COL1_X = _PC_PAD
+_PC_COL2_X = _PC_W // 2 + 10
+_PC_LABEL_Y = 192
+_PC_VALUE_Y = 214
+_PC_FOOT_Y = _PC_H - 42
+_PC_HERO_Y = 76     # light theme hero tint
+_PC_HERO_H = 68
+
+_PERIODIC_TEMPLATE_CACHE: dict[tuple[str, bool], Image.Image] = {}
+
+
+def _periodic_template(theme: str, positive: bool = True) -> Image.Image:
+    """Pre-rendered periodic card chrome: border, metric labels, LIVE footer.
+
+    The light theme also bakes in the green/red hero tint, so it has one
+    template per PnL sign. Renderers copy it and draw only the data on top.
+    """
+    light = theme == "light"
+    key = (theme, positive or not light)
+    tpl = _PERIODIC_TEMPLATE_CACHE.get(key)
+    if tpl is not None:
+        return tpl
+
+    bg, edge, muted, live = (
+        (L_BG, L_BORDER, L_TEXT_MUT, L_GREEN) if light
+        else (_P_BG, _P_CARD_EDGE, _P_GREY, _P_GREEN)
+    )
+    divider = L_BORDER if light else _P_DIVIDER
+
+    tpl = Image.new("RGB", (_PC_W, _PC_H), bg)
+    draw = ImageDraw.Draw(tpl)
+    pf = _periodic_fonts()
+
+    if light:
+        draw.rectangle([(0, 0), (_PC_W, 3)], fill=L_ACCENT)
+    draw.rectangle([(0, 0), (_PC_W - 1, _PC_H - 1)], outline=edge, width=2)
+    if light:
+        draw.rounded_rectangle(
+            [(_PC_PAD - 12, _PC_HERO_Y), (_PC_W - _PC_PAD + 12, _PC_HERO_Y + _PC_HERO_H)],
+            radius=10, fill=L_GREEN_BG if positive else L_RED_BG,
+        )
+
+    _text(draw, _PC_COL1_X, _PC_LABEL_Y, "Matched Trades", pf["r18"], muted)
+    _text(draw, _PC_COL2_X, _PC_LABEL_Y, "Net Earned", pf["r18"], muted)
+
+    draw.line([(_PC_PAD, _PC_FOOT_Y), (_PC_W - _PC_PAD, _PC_FOOT_Y)], fill=divider, width=1)
+    fy = _PC_FOOT_Y + 12
+    dot_cx = _PC_PAD + 8
+    dot_cy = fy + 8
+    draw.ellipse([(dot_cx - 5, dot_cy - 5), (dot_cx + 5, dot_cy + 5)], fill=live)
+    _text(draw, dot_cx + 16, fy, "LIVE", pf["b20"], live)
+
+    _PERIODIC_TEMPLATE_CACHE[key] = tpl
+    return tpl
 
 
 def _render_periodic_card(
@@ -332,17 +577,15 @@ def _render_periodic_card(
     delta_roundtrips: int,
     delta_profit: float,
     uptime: str,
+    timestamp: str,
 ) -> Image.Image:
-    img = Image.new("RGB", (_PC_W, _PC_H), _P_BG)
+    img = _periodic_template("dark").copy()
     draw = ImageDraw.Draw(img)
     pf = _periodic_fonts()
-    pad = 34
+    pad = _PC_PAD
 
     pnl_color = _lp_color(total_profit)
 
-    # ── Subtle card border for Telegram dark mode visibility ──
-    draw.rectangle([(0, 0), (_PC_W - 1, _PC_H - 1)], outline=_P_CARD_EDGE, width=2)
-
     # ── Symbol + Strategy type ──
     _text(draw, pad, 20, f"{symbol}  {strategy_type}", pf["b34"], _P_WHITE)
     # ── Label | Uptime ──
@@ -350,37 +593,21 @@ def _render_periodic_card(
 
     # ── Hero profit number ──
     pnl_str = _signed(total_profit)
-    _text(draw, pad, 82, pnl_str, pf["hero"], pnl_color)
+    _text_glyphs(img, pad, 82, pnl_str, pf["hero"], pnl_color)
 
     # ── Delta this period ──
     delta_str = f"{_signed(delta_profit)} this period"
     _text(draw, pad, 142, delta_str, pf["b20"], _lp_color(delta_profit))
 
-    # ── Bottom metrics: two columns ──
-    col1_x = pad
-    col2_x = _PC_W // 2 + 10
-    label_y = 192
-    value_y = 214
-
-    _text(draw, col1_x, label_y, "Matched Trades", pf["r18"], _P_GREY)
+    # ── Bottom metrics: two columns (labels come from the template) ──
     trades_val = str(roundtrips)
     if delta_roundtrips > 0:
         trades_val = f"{roundtrips}  (+{delta_roundtrips})"
-    _text(draw, col1_x, value_y, trades_val, pf["b28"], _P_WHITE)
-
-    _text(draw, col2_x, label_y, "Net Earned", pf["r18"], _P_GREY)
-    _text(draw, col2_x, value_y, _signed(delta_profit), pf["b28"], _lp_color(delta_profit))
+    _text(draw, _PC_COL1_X, _PC_VALUE_Y, trades_val, pf["b28"], _P_WHITE)
+    _text(draw, _PC_COL2_X, _PC_VALUE_Y, _signed(delta_profit), pf["b28"], _lp_color(delta_profit))
 
-    # ── Footer ──
-    foot_y = _PC_H - 42
-    draw.line([(pad, foot_y), (_PC_W - pad, foot_y)], fill=_P_DIVIDER, width=1)
-    fy = foot_y + 12
-    dot_cx = pad + 8
-    dot_cy = fy + 8
-    draw.ellipse([(dot_cx - 5, dot_cy - 5), (dot_cx + 5, dot_cy + 5)], fill=_P_GREEN)
-    _text(draw, dot_cx + 16, fy, "LIVE", pf["b20"], _P_GREEN)
-    ts = datetime.now().strftime("%H:%M  %b %d")
-    _text_right(draw, _PC_W - pad, fy, ts, pf["r16"], _P_GREY)
+    # ── Footer timestamp ──
+    _text_right(draw, _PC_W - pad, _PC_FOOT_Y + 12, timestamp, pf["r16"], _P_GREY)
 
     return img
 
@@ -394,112 +621,94 @@ def _render_periodic_card_light(
     delta_roundtrips: int,
     delta_profit: float,
     uptime: str,
+    timestamp: str,
 ) -> Image.Image:
     """Light-theme periodic card — white/blue palette, same layout as dark."""
-    img = Image.new("RGB", (_PC_W, _PC_H), L_BG)
+    img = _periodic_template("light", total_profit >= 0).copy()
     draw = ImageDraw.Draw(img)
     pf = _periodic_fonts()
-    pad = 34
+    pad = _PC_PAD
 
     pnl_color = _pal_pnl_color(total_profit, _LIGHT_PAL)
 
-    # ── Top accent bar (3px blue) + subtle border ──
-    draw.rectangle([(0, 0), (_PC_W, 3)], fill=L_ACCENT)
-    draw.rectangle([(0, 0), (_PC_W - 1, _PC_H - 1)], outline=L_BORDER, width=2)
-
     # ── Symbol + Strategy type ──
     _text(draw, pad, 20, f"{symbol}  {strategy_type}", pf["b34"], L_TEXT_PRI)
 
     # ── Label | Uptime ──
     _text(draw, pad, 52, f"{label}  |  {uptime}", pf["r18"], L_TEXT_MUT)
 
-    # ── Hero PnL number on tinted background ──
-    hero_y = 76
-    hero_h = 68
-    pnl_bg = _pal_pnl_bg(total_profit, _LIGHT_PAL)
-    draw.rounded_rectangle(
-        [(pad - 12, hero_y), (_PC_W - pad + 12, hero_y + hero_h)],
-        radius=10, fill=pnl_bg,
-    )
+    # ── Hero PnL number on tinted background (tint comes from the template) ──
+    hero_y = _PC_HERO_Y
+    hero_h = _PC_HERO_H
 
     pnl_str = _signed(total_profit)
-    bb = _textsize(draw, pnl_str, pf["hero"])
+    bb = _textsize(pnl_str, pf["hero"])
     pnl_text_h = bb[3] - bb[1]
     pnl_y = hero_y + (hero_h - pnl_text_h) // 2
-    _text(draw, pad, pnl_y, pnl_str, pf["hero"], pnl_color)
+    _text_glyphs(img, pad, pnl_y, pnl_str, pf["hero"], pnl_color)
 
     # ── Delta this period ──
     delta_str = f"{_signed(delta_profit)} this period"
     _text(draw, pad, hero_y + hero_h + 10, delta_str, pf["b20"], _pal_pnl_color(delta_profit, _LIGHT_PAL))
 
-    # ── Bottom metrics: two columns ──
-    col1_x = pad
-    col2_x = _PC_W // 2 + 10
-    label_y = 192
-    value_y = 214
-
-    _text(draw, col1_x, label_y, "Matched Trades", pf["r18"], L_TEXT_MUT)
+    # ── Bottom metrics: two columns (labels come from the template) ──
     trades_val = str(roundtrips)
     if delta_roundtrips > 0:
         trades_val = f"{roundtrips}  (+{delta_roundtrips})"
-    _text(draw, col1_x, value_y, trades_val, pf["b28"], L_TEXT_PRI)
-
-    _text(draw, col2_x, label_y, "Net Earned", pf["r18"], L_TEXT_MUT)
-    _text(draw, col2_x, value_y, _signed(delta_profit), pf["b28"], _pal_pnl_color(delta_profit, _LIGHT_PAL))
+    _text(draw, _PC_COL1_X, _PC_VALUE_Y, trades_val, pf["b28"], L_TEXT_PRI)
+    _text(draw, _PC_COL2_X, _PC_VALUE_Y, _signed(delta_profit), pf["b28"], _pal_pnl_color(delta_profit, _LIGHT_PAL))
 
-    # ── Footer ──
-    foot_y = _PC_H - 42
-    draw.line([(pad, foot_y), (_PC_W - pad, foot_y)], fill=L_BORDER, width=1)
-    fy = foot_y + 12
-    dot_cx = pad + 8
-    dot_cy = fy + 8
-    draw.ellipse([(dot_cx - 5, dot_cy - 5), (dot_cx + 5, dot_cy + 5)], fill=L_GREEN)
-    _text(draw, dot_cx + 16, fy, "LIVE", pf["b20"], L_GREEN)
-    ts = datetime.now().strftime("%H:%M  %b %d")
-    _text_right(draw, _PC_W - pad, fy, ts, pf["r16"], L_TEXT_MUT)
+    # ── Footer timestamp ──
+    _text_right(draw, _PC_W - pad, _PC_FOOT_Y + 12, timestamp, pf["r16"], L_TEXT_MUT)
 
     return img
 
 
-def build_periodic_card(label: str, state: "BotState", theme: str = "dark") -> io.BytesIO:
+_STRATEGY_NAMES = {SpotGridSummary: "Spot Grid", PerpGridSummary: "Perp Grid"}
+
+
+def build_periodic_card(
+    label: str, state: "BotState | CardSnapshot", theme: str = "dark",
+) -> io.BytesIO:
     """Generate a compact periodic PNG card focused on trades & profit.
 
-    Returns BytesIO seeked to 0. Raises ValueError if state.summary is None.
+    Accepts a live BotState (snapshotted here) or a CardSnapshot taken on
+    the loop thread. Returns BytesIO seeked to 0.
+    Raises ValueError if the summary is None.
     """
-    from .models import PerpGridSummary, SpotGridSummary
-
-    if state.summary is None:
+    snap = state if isinstance(state, CardSnapshot) else card_snapshot(state)
+    summary = snap.summary
+    if summary is None:
         raise ValueError(f"No summary data available for {label!r}")
 
-    delta_roundtrips = state.summary.roundtrips - state.prev_roundtrips
-    delta_profit = (
-        (state.summary.matched_profit - state.prev_matched_profit)
-        - (state.summary.total_fees - state.prev_total_fees)
-    )
+    prev_trades, prev_matched, prev_fees = snap.prev_snapshot
+    delta_roundtrips = summary.roundtrips - prev_trades
+    delta_profit = (summary.matched_profit - prev_matched) - (summary.total_fees - prev_fees)
 
-    if isinstance(state.summary, SpotGridSummary):
-        stype = "Spot Grid"
-    elif isinstance(state.summary, PerpGridSummary):
-        stype = "Perp Grid"
-    else:
-        stype = "Grid"
+    timestamp = _clock()[2]
+    key = (
+        "periodic", theme, label, type(summary), astuple(summary),
+        delta_roundtrips, delta_profit, timestamp,
+    )
+    cached = _cached_card(key)
+    if cached is not None:
+        return cached
 
+    stype = _STRATEGY_NAMES.get(type(summary), "Grid")
     renderer = _render_periodic_card_light if theme == "light" else _render_periodic_card
     img = renderer(
         label=label,
-        symbol=state.summary.symbol,
+        symbol=summary.symbol,
         strategy_type=stype,
-        total_profit=state.summary.matched_profit,
-        roundtrips=state.summary.roundtrips,
+        total_profit=summary.matched_profit,
+        roundtrips=summary.roundtrips,
         delta_roundtrips=delta_roundtrips,
         delta_profit=delta_profit,
-        uptime=state.summary.uptime,
+        uptime=summary.uptime,
+        timestamp=timestamp,
     )
 
-    buf = io.BytesIO()
-    img.save(buf, format="PNG", optimize=True)
-    buf.seek(0)
-    return buf
+    return _store_card(key, img)
 
 
 # ---------------------------------------------------------------------------
@@ -511,22 +720,34 @@ def build_periodic_card(label: str, state: "BotState", theme: str = "dark") -> i
 # ---------------------------------------------------------------------------
 
 _LIGHT_PAL = {
+    "name": "light",
     "bg": L_BG, "section": L_SECTION, "border": L_BORDER,
     "accent": L_ACCENT, "accent_dim": L_ACCENT_DIM, "accent_bg": L_ACCENT_BG,
     "green": L_GREEN, "red": L_RED, "gold": L_GOLD,
     "text_pri": L_TEXT_PRI, "text_sec": L_TEXT_SEC, "text_mut": L_TEXT_MUT,
     "green_bg": L_GREEN_BG, "red_bg": L_RED_BG, "gold_bg": (255, 251, 235),
+    "testnet": (139, 92, 246),
 }
 
 _DARK_PAL = {
+    "name": "dark",
     "bg": C_BG, "section": C_SECTION, "border": C_BORDER,
     "accent": C_CYAN, "accent_dim": C_CYAN_DIM, "accent_bg": C_CYAN_BG,
     "green": C_GREEN, "red": C_RED, "gold": C_GOLD,
     "text_pri": C_TEXT_PRI, "text_sec": C_TEXT_SEC, "text_mut": C_TEXT_MUT,
     "green_bg": C_GREEN_BG, "red_bg": C_RED_BG, "gold_bg": C_GOLD_BG,
+    "testnet": (139, 92, 246),
 }
 
 
+# Palette tone per exchange / network / badge value; badges use tone + "_bg"
+# as their fill. Anything not listed falls back to the .get() default.
+_EXCHANGE_TONE = {"hyperliquid": "accent"}
+_NETWORK_TONE = {"mainnet": "green"}
+_GRID_TYPE_TONE = {"SPOT": "accent"}
+_DIRECTION_TONE = {"long": "green", "short": "red"}  # grid bias and position side
+
+
 def _pal_pnl_color(value: float, p: dict) -> tuple:
     return p["green"] if value >= 0 else p["red"]
 
@@ -536,53 +757,96 @@ def _pal_pnl_bg(value: float, p: dict) -> tuple:
 
 
 def _ls_divider(draw: ImageDraw.ImageDraw, y: int, p: dict) -> None:
-    draw.line([(0, y), (_LS_W, y)], fill=p["border"], width=1)
+    _fill_rect(draw, (0, y, _LS_W, y + 1), p["border"])
 
 
 def _ls_vdivider(draw: ImageDraw.ImageDraw, x: int, y: int, h: int, p: dict) -> None:
-    draw.line([(x, y), (x, y + h)], fill=p["border"], width=1)
+    _fill_rect(draw, (x, y, x + 1, y + h + 1), p["border"])
+
+
+def _ls_draw_accent_bar(draw: ImageDraw.ImageDraw, p: dict) -> None:
+    """Top accent bar; the canvas itself is created with the bg colour."""
+    draw.rectangle([(0, 0), (_LS_W, _LS_ACCENT_H)], fill=p["accent"])
+
+
+def _ls_row_chrome(draw: ImageDraw.ImageDraw, y: int, h: int, p: dict) -> int:
+    """Draw the divider closing a row of height h. Returns next Y."""
+    end_y = y + h
+    _ls_divider(draw, end_y, p)
+    return end_y + 1
+
+
+def _ls_pnl_chrome(draw: ImageDraw.ImageDraw, y: int, p: dict, perp: bool) -> int:
+    """Draw the static half of the PnL section: breakdown panel and its labels."""
+    f = _status_fonts()
+    h = _LS_PNL_H
+    mid_x = _LS_W // 2
+
+    draw.rectangle([(mid_x, y), (_LS_W, y + h)], fill=p["section"])
+    _ls_vdivider(draw, mid_x, y, h, p)
+
+    labels = ("REALIZED", "UNREALIZED", "FEES", "TRADES") if perp else ("MATCHED", "FEES", "TRADES")
+    for i, text in enumerate(labels):
+        _text(draw, mid_x + _LS_PAD, y + 24 + i * 32, text, f["r14"], p["text_mut"])
 
+    return _ls_row_chrome(draw, y, h, p)
 
-def _ls_draw_background(img: Image.Image, draw: ImageDraw.ImageDraw, h: int, p: dict) -> None:
-    draw.rectangle([(0, 0), (_LS_W, h)], fill=p["bg"])
-    draw.rectangle([(0, 0), (_LS_W, 4)], fill=p["accent"])
+
+def _ls_metric_row_chrome(
+    draw: ImageDraw.ImageDraw, y: int, labels: tuple[str | None, ...], p: dict,
+) -> int:
+    """Draw metric row column dividers and fixed labels (None = per-card label)."""
+    f = _status_fonts()
+    h = _LS_METRIC_H
+    n = len(labels)
+
+    for x_start in _LS_COL_EDGES[n][1:]:
+        _ls_vdivider(draw, x_start, y, h, p)
+    for cx, label in zip(_LS_COL_CENTERS[n], labels, strict=True):
+        if label is not None:
+            _text_centered(draw, cx, y + 20, label.upper(), f["r14"], p["text_mut"])
+
+    return _ls_row_chrome(draw, y, h, p)
 
 
 def _ls_draw_header(
-    draw: ImageDraw.ImageDraw, y: int, label: str, exchange: str, network: str, p: dict,
+    img: Image.Image, draw: ImageDraw.ImageDraw, y: int,
+    label: str, exchange: str, network: str, time_str: str, p: dict,
 ) -> int:
     """Draw header row. Returns next Y."""
     f = _status_fonts()
-    h = 64
+    h = _LS_HEADER_H
 
     _text_vcenter(draw, _LS_PAD, y, h, label, f["b20"], p["text_pri"])
 
     mf = f["mn14"]
     exch_u = exchange.upper()
     net_u = network.upper()
-    exch_color = p["accent"] if exchange.lower() == "hyperliquid" else p["gold"]
-    net_color = p["green"] if network.lower() == "mainnet" else (139, 92, 246)
+    exch_color = p[_EXCHANGE_TONE.get(exchange.lower(), "gold")]
+    net_color = p[_NETWORK_TONE.get(network.lower(), "testnet")]
 
-    exch_w = _tw(draw, exch_u, mf)
-    sep_w = _tw(draw, " \u00b7 ", mf)
-    net_w = _tw(draw, net_u, mf)
+    exch_w = _tw(exch_u, mf)
+    sep_w = _tw(" \u00b7 ", mf)
+    net_w = _tw(net_u, mf)
     total_w = exch_w + sep_w + net_w
     cx_start = (_LS_W - total_w) // 2
 
-    bb = _textsize(draw, exch_u, mf)
+    bb = _textsize(exch_u, mf)
     th = bb[3] - bb[1]
     ty = y + (h - th) // 2
 
-    _text(draw, cx_start, ty, exch_u, mf, exch_color)
-    _text(draw, cx_start + exch_w, ty, " \u00b7 ", mf, p["text_mut"])
-    _text(draw, cx_start + exch_w + sep_w, ty, net_u, mf, net_color)
+    # Monospace readouts: composite cached glyph masks
+    _text_glyphs(img, cx_start, ty, exch_u, mf, exch_color)
+    _text_glyphs(img, cx_start + exch_w, ty, " \u00b7 ", mf, p["text_mut"])
+    _text_glyphs(img, cx_start + exch_w + sep_w, ty, net_u, mf, net_color)
 
-    ts = datetime.now().strftime("%H:%M")
-    _text_vcenter_right(draw, _LS_W - _LS_PAD, y, h, ts, f["mn14"], p["text_mut"])
+    bb = _textsize(time_str, mf)
+    _text_glyphs(
+        img, _LS_W - _LS_PAD - (bb[2] - bb[0]), y + (h - (bb[3] - bb[1])) // 2,
+        time_str, mf, p["text_mut"],
+    )
 
-    end_y = y + h
-    _ls_divider(draw, end_y, p)
-    return end_y + 1
+    return y + h + 1
 
 
 def _ls_draw_symbol_row(
@@ -597,10 +861,10 @@ def _ls_draw_symbol_row(
 ) -> int:
     """Draw symbol row with badges. Returns next Y."""
     f = _status_fonts()
-    h = 60
+    h = _LS_SYMBOL_H
 
     sym_font = f["b28"]
-    bb = _textsize(draw, symbol, sym_font)
+    bb = _textsize(symbol, sym_font)
     sym_h = bb[3] - bb[1]
     sym_y = y + (h - sym_h) // 2
     _text(draw, _LS_PAD, sym_y, symbol, sym_font, p["text_pri"])
@@ -608,28 +872,18 @@ def _ls_draw_symbol_row(
 
     badge_x = _LS_PAD + sym_w + 12
     badge_y = y + h // 2 - 12
-    if grid_type == "SPOT":
-        badge_color, badge_bg = p["accent"], p["accent_bg"]
-    else:
-        badge_color, badge_bg = p["gold"], p["gold_bg"]
-    next_x = _badge(draw, badge_x, badge_y, grid_type, badge_color, badge_bg, f["b14"])
+    tone = _GRID_TYPE_TONE.get(grid_type, "gold")
+    next_x = _badge(draw, badge_x, badge_y, grid_type, p[tone], p[tone + "_bg"], f["b14"])
 
     if grid_type == "PERP" and grid_bias and leverage is not None:
-        if grid_bias.lower() == "long":
-            bias_color, bias_bg = p["green"], p["green_bg"]
-        elif grid_bias.lower() == "short":
-            bias_color, bias_bg = p["red"], p["red_bg"]
-        else:
-            bias_color, bias_bg = p["accent"], p["accent_bg"]
+        tone = _DIRECTION_TONE.get(grid_bias.lower(), "accent")
         _badge(draw, next_x + 8, badge_y, f"{grid_bias.upper()} {leverage}\u00d7",
-               bias_color, bias_bg, f["b14"])
+               p[tone], p[tone + "_bg"], f["b14"])
 
     uptime_str = f"uptime  {uptime}"
     _text_vcenter_right(draw, _LS_W - _LS_PAD, y, h, uptime_str, f["r16"], p["text_mut"])
 
-    end_y = y + h
-    _ls_divider(draw, end_y, p)
-    return end_y + 1
+    return y + h + 1
 
 
 def _ls_draw_pnl_section(
@@ -642,14 +896,13 @@ def _ls_draw_pnl_section(
     p: dict,
     unrealized_pnl: float | None = None,
 ) -> int:
-    """Draw PnL section: hero number left, breakdown right. Returns next Y."""
+    """Draw PnL section: hero number left, breakdown values right. Returns next Y."""
     f = _status_fonts()
-    h = 150
+    h = _LS_PNL_H
     mid_x = _LS_W // 2
 
-    draw.rectangle([(0, y), (mid_x - 1, y + h)], fill=_pal_pnl_bg(net_profit, p))
-    draw.rectangle([(mid_x, y), (_LS_W, y + h)], fill=p["section"])
-    _ls_vdivider(draw, mid_x, y, h, p)
+    # The closing divider row belongs to the template, so stop the tint above it.
+    _fill_rect(draw, (0, y, mid_x, y + h), _pal_pnl_bg(net_profit, p))
 
     label_y = y + 24
     _text(draw, _LS_PAD, label_y, "NET PROFIT", f["r14"], p["text_mut"])
@@ -660,62 +913,46 @@ def _ls_draw_pnl_section(
     _text(draw, _LS_PAD, pnl_y, pnl_text, pnl_font, _pal_pnl_color(net_profit, p))
 
     if unrealized_pnl is not None:
-        pbb = _textsize(draw, pnl_text, pnl_font)
+        pbb = _textsize(pnl_text, pnl_font)
         unreal_y = pnl_y + (pbb[3] - pbb[1]) + 10
         unreal_str = f"unrealized  {_signed(unrealized_pnl)}"
         _text(draw, _LS_PAD, unreal_y, unreal_str, f["r14"], _pal_pnl_color(unrealized_pnl, p))
 
-    rx = mid_x + _LS_PAD
     row_y = y + 24
     row_gap = 32
 
+    _text_right(draw, _LS_W - _LS_PAD, row_y, _signed(matched_profit), f["b16"], _pal_pnl_color(matched_profit, p))
     if unrealized_pnl is not None:
-        _text(draw, rx, row_y, "REALIZED", f["r14"], p["text_mut"])
-        _text_right(draw, _LS_W - _LS_PAD, row_y, _signed(matched_profit), f["b16"], _pal_pnl_color(matched_profit, p))
         row_y += row_gap
-        _text(draw, rx, row_y, "UNREALIZED", f["r14"], p["text_mut"])
         _text_right(draw, _LS_W - _LS_PAD, row_y, _signed(unrealized_pnl), f["b16"], _pal_pnl_color(unrealized_pnl, p))
-    else:
-        _text(draw, rx, row_y, "MATCHED", f["r14"], p["text_mut"])
-        _text_right(draw, _LS_W - _LS_PAD, row_y, _signed(matched_profit), f["b16"], _pal_pnl_color(matched_profit, p))
 
     row_y += row_gap
-    _text(draw, rx, row_y, "FEES", f["r14"], p["text_mut"])
     _text_right(draw, _LS_W - _LS_PAD, row_y, f"-${_fp(total_fees)}", f["b16"], p["red"])
 
     row_y += row_gap
-    _text(draw, rx, row_y, "TRADES", f["r14"], p["text_mut"])
     _text_right(draw, _LS_W - _LS_PAD, row_y, str(roundtrips), f["b16"], p["text_pri"])
 
-    end_y = y + h
-    _ls_divider(draw, end_y, p)
-    return end_y + 1
+    return y + h + 1
 
 
 def _ls_draw_metric_row(
     draw: ImageDraw.ImageDraw,
     y: int,
-    cells: list[tuple[str, str, tuple]],
+    cells: list[tuple[str | None, str, tuple]],
     p: dict,
 ) -> int:
-    """Equal-width metric cells: label on top, bold value below. Returns next Y."""
-    f = _status_fonts()
-    h = 96
-    col_w = _LS_W // len(cells)
+    """Equal-width metric cells: label on top, bold value below. Returns next Y.
 
-    for i, (label, value, color) in enumerate(cells):
-        x_start = i * col_w
-        cx = x_start + col_w // 2
-
-        if i > 0:
-            _ls_vdivider(draw, x_start, y, h, p)
+    A None label means the template already carries it.
+    """
+    f = _status_fonts()
 
-        _text_centered(draw, cx, y + 20, label.upper(), f["r14"], p["text_mut"])
+    for cx, (label, value, color) in zip(_LS_COL_CENTERS[len(cells)], cells, strict=True):
+        if label is not None:
+            _text_centered(draw, cx, y + 20, label.upper(), f["r14"], p["text_mut"])
         _text_centered(draw, cx, y + 48, value, f["b20"], color)
 
-    end_y = y + h
-    _ls_divider(draw, end_y, p)
-    return end_y + 1
+    return y + _LS_METRIC_H + 1
 
 
 def _ls_draw_grid_section(
@@ -734,33 +971,42 @@ def _ls_draw_grid_section(
     spacing = _format_spacing(grid_spacing_pct)
     trigger_str = f"${_fp(trigger)}" if trigger is not None else "\u2014"
 
+    # Range / Zones / Spread
     y = _ls_draw_metric_row(draw, y, [
-        ("Range", range_str, p["text_pri"]),
-        ("Zones", str(grid_count), p["text_pri"]),
-        ("Spread", spacing, p["text_pri"]),
+        (None, range_str, p["text_pri"]),
+        (None, str(grid_count), p["text_pri"]),
+        (None, spacing, p["text_pri"]),
     ], p)
 
+    # Trigger / Investment
     y = _ls_draw_metric_row(draw, y, [
-        ("Trigger", trigger_str, p["text_pri"]),
-        ("Investment", f"${_fp(investment)}", p["text_pri"]),
+        (None, trigger_str, p["text_pri"]),
+        (None, f"${_fp(investment)}", p["text_pri"]),
     ], p)
 
     return y
 
 
-def _ls_draw_footer(draw: ImageDraw.ImageDraw, y: int, state: str, p: dict) -> int:
+@functools.lru_cache(maxsize=1)
+def _dot_mask():
+    """Coverage mask for the 11px footer status dot, drawn once."""
+    mask = Image.new("L", (11, 11), 0)
+    ImageDraw.Draw(mask).ellipse([(0, 0), (10, 10)], fill=255)
+    return mask.im
+
+
+def _ls_draw_footer(draw: ImageDraw.ImageDraw, y: int, state: str, date_str: str, p: dict) -> int:
     """Draw footer with status dot + state label + date. Returns next Y."""
     f = _status_fonts()
-    h = 52
+    h = _LS_FOOTER_H
 
     dot_color = p["green"] if state.lower() == "running" else p["gold"]
     dot_cx = _LS_PAD + 8
     dot_cy = y + h // 2
-    draw.ellipse([(dot_cx - 5, dot_cy - 5), (dot_cx + 5, dot_cy + 5)], fill=dot_color)
+    _blit(draw, dot_cx - 5, dot_cy - 5, _dot_mask(), dot_color)
     _text_vcenter(draw, dot_cx + 14, y, h, state.upper(), f["r16"], dot_color)
 
-    ts = datetime.now().strftime("%b %d")
-    _text_vcenter_right(draw, _LS_W - _LS_PAD, y, h, ts, f["r14"], p["text_mut"])
+    _text_vcenter_right(draw, _LS_W - _LS_PAD, y, h, date_str, f["r14"], p["text_mut"])
 
     return y + h
 
@@ -769,6 +1015,47 @@ def _ls_draw_footer(draw: ImageDraw.ImageDraw, y: int, state: str, p: dict) -> i
 # Status card builders (shared layout, theme-driven palette)
 # ---------------------------------------------------------------------------
 
+# Fixed metric labels baked into the templates; None marks a per-symbol label.
+_SPOT_HOLDINGS_LABELS = (None, None, "Entry Price")
+_PERP_POSITION_LABELS = ("Position", None, "Avg Entry")
+_GRID_ROW_LABELS = (("Range", "Zones", "Spread"), ("Trigger", "Investment"))
+
+_STATUS_TEMPLATE_CACHE: dict[tuple[bool, str], Image.Image] = {}
+
+
+def _status_template(perp: bool, p: dict) -> Image.Image:
+    """Pre-rendered status card chrome: background, dividers, fixed labels.
+
+    Built once per (variant, theme) at the card's exact height; renderers
+    copy it and draw only the bot data on top.
+    """
+    key = (perp, p["name"])
+    tpl = _STATUS_TEMPLATE_CACHE.get(key)
+    if tpl is not None:
+        return tpl
+
+    h = (
+        _LS_ACCENT_H + _LS_HEADER_H + _LS_SYMBOL_H + _LS_PNL_H
+        + (_LS_MODE_H + 1 if perp else 0)
+        + 3 * (_LS_METRIC_H + 1) + 3 + _LS_FOOTER_H
+    )
+    tpl = Image.new("RGB", (_LS_W, h), p["bg"])
+    draw = ImageDraw.Draw(tpl)
+    _ls_draw_accent_bar(draw, p)
+
+    y = _ls_row_chrome(draw, _LS_ACCENT_H, _LS_HEADER_H, p)
+    y = _ls_row_chrome(draw, y, _LS_SYMBOL_H, p)
+    y = _ls_pnl_chrome(draw, y, p, perp)
+    y = _ls_metric_row_chrome(draw, y, _PERP_POSITION_LABELS if perp else _SPOT_HOLDINGS_LABELS, p)
+    if perp:
+        y = _ls_row_chrome(draw, y, _LS_MODE_H, p)
+    for labels in _GRID_ROW_LABELS:
+        y = _ls_metric_row_chrome(draw, y, labels, p)
+
+    _STATUS_TEMPLATE_CACHE[key] = tpl
+    return tpl
+
+
 def _render_spot_status_card(
     label: str,
     exchange: str,
@@ -776,16 +1063,14 @@ def _render_spot_status_card(
     summary: "SpotGridSummary",
     trigger: float | None,
     investment: float,
+    clock: tuple[str, str, str],
     p: dict,
 ) -> Image.Image:
-    max_h = 900
-    img = Image.new("RGB", (_LS_W, max_h), p["bg"])
+    img = _status_template(False, p).copy()
     draw = ImageDraw.Draw(img)
 
-    _ls_draw_background(img, draw, max_h, p)
-
-    y = 4
-    y = _ls_draw_header(draw, y, label, exchange, network, p)
+    y = _LS_ACCENT_H
+    y = _ls_draw_header(img, draw, y, label, exchange, network, clock[0], p)
     y = _ls_draw_symbol_row(draw, y, summary.symbol, "SPOT", summary.uptime, p)
 
     net_profit = summary.total_profit
@@ -802,7 +1087,7 @@ def _render_spot_status_card(
     y = _ls_draw_metric_row(draw, y, [
         (base_ticker, f"{summary.base_balance:.4f}", p["text_pri"]),
         (quote_ticker, f"${_fp(summary.quote_balance)}", p["text_pri"]),
-        ("Entry Price", entry_str, p["text_pri"]),
+        (None, entry_str, p["text_pri"]),  # Entry Price
     ], p)
 
     y = _ls_draw_grid_section(
@@ -810,9 +1095,9 @@ def _render_spot_status_card(
         summary.grid_count, summary.grid_spacing_pct, trigger, investment, p,
     )
 
-    y = _ls_draw_footer(draw, y, summary.state, p)
+    _ls_draw_footer(draw, y, summary.state, clock[1], p)
 
-    return img.crop((0, 0, _LS_W, y))
+    return img
 
 
 def _render_perp_status_card(
@@ -823,16 +1108,14 @@ def _render_perp_status_card(
     trigger: float | None,
     investment: float,
     is_isolated: bool,
+    clock: tuple[str, str, str],
     p: dict,
 ) -> Image.Image:
-    max_h = 900
-    img = Image.new("RGB", (_LS_W, max_h), p["bg"])
+    img = _status_template(True, p).copy()
     draw = ImageDraw.Draw(img)
 
-    _ls_draw_background(img, draw, max_h, p)
-
-    y = 4
-    y = _ls_draw_header(draw, y, label, exchange, network, p)
+    y = _LS_ACCENT_H
+    y = _ls_draw_header(img, draw, y, label, exchange, network, clock[0], p)
     y = _ls_draw_symbol_row(
         draw, y, summary.symbol, "PERP", summary.uptime, p,
         grid_bias=summary.grid_bias, leverage=summary.leverage,
@@ -848,67 +1131,96 @@ def _render_perp_status_card(
     parts = summary.symbol.split("/")
     quote_ticker = parts[1] if len(parts) > 1 else "USDC"
 
-    side = summary.position_side.lower()
-    pos_color = p["green"] if side == "long" else p["red"] if side == "short" else p["text_mut"]
+    pos_color = p[_DIRECTION_TONE.get(summary.position_side.lower(), "text_mut")]
     pos_text = f"{summary.position_side}  {abs(summary.position_size):.4f}"
     margin_mode = "isolated" if is_isolated else "cross"
 
     y = _ls_draw_metric_row(draw, y, [
-        ("Position", pos_text, pos_color),
+        (None, pos_text, pos_color),  # Position
         (f"Margin ({quote_ticker})", f"${_fp(summary.margin_balance)}", p["text_pri"]),
-        ("Avg Entry", f"${_fp(summary.avg_entry_price)}", p["text_pri"]),
+        (None, f"${_fp(summary.avg_entry_price)}", p["text_pri"]),  # Avg Entry
     ], p)
 
     f = _status_fonts()
-    mode_h = 36
-    _text_vcenter(draw, _LS_PAD, y, mode_h, f"Margin: {margin_mode}", f["r14"], p["text_mut"])
-    _ls_divider(draw, y + mode_h, p)
-    y = y + mode_h + 1
+    _text_vcenter(draw, _LS_PAD, y, _LS_MODE_H, f"Margin: {margin_mode}", f["r14"], p["text_mut"])
+    y = y + _LS_MODE_H + 1
 
     y = _ls_draw_grid_section(
         draw, y, summary.grid_range_low, summary.grid_range_high,
         summary.grid_count, summary.grid_spacing_pct, trigger, investment, p,
     )
 
-    y = _ls_draw_footer(draw, y, summary.state, p)
+    _ls_draw_footer(draw, y, summary.state, clock[1], p)
+
+    return img
+
 
-    return img.crop((0, 0, _LS_W, y))
+# Status renderer per summary type, called as (label, snapshot, clock, palette);
+# only the perp card reads the margin mode.
+_STATUS_RENDERERS: dict[type, Callable[..., Image.Image]] = {
+    SpotGridSummary: lambda label, s, clock, p: _render_spot_status_card(
+        label, s.exchange, s.network, s.summary, s.trigger, s.investment, clock, p,
+    ),
+    PerpGridSummary: lambda label, s, clock, p: _render_perp_status_card(
+        label, s.exchange, s.network, s.summary, s.trigger, s.investment,
+        s.is_isolated, clock, p,
+    ),
+}
 
 
-def build_status_card(label: str, state: "BotState", theme: str = "light") -> io.BytesIO:
+def build_status_card(
+    label: str, state: "BotState | CardSnapshot", theme: str = "light",
+) -> io.BytesIO:
     """Generate a PNG status card from bot state.
 
     theme="light" uses white/blue palette; theme="dark" uses dark palette.
-    Both share the same layout. Returns BytesIO seeked to 0.
-    Raises ValueError if state.summary is None.
+    Both share the same layout. Accepts a live BotState (snapshotted here)
+    or a CardSnapshot taken on the loop thread. Returns BytesIO seeked to 0.
+    Raises ValueError if the summary is None.
     """
-    from .models import PerpGridSummary, SpotGridSummary
-
-    if state.summary is None:
+    snap = state if isinstance(state, CardSnapshot) else card_snapshot(state)
+    summary = snap.summary
+    if summary is None:
         raise ValueError(f"No summary data available for {label!r}")
 
     p = _DARK_PAL if theme == "dark" else _LIGHT_PAL
 
-    exchange = state.info.exchange if state.info else "unknown"
-    network = state.info.network if state.info else "unknown"
+    renderer = _STATUS_RENDERERS.get(type(summary))
+    if renderer is None:
+        raise ValueError(f"Unknown summary type for {label!r}: {type(summary)}")
 
-    trigger = state.config.trigger_price if state.config else None
-    investment = state.config.total_investment if state.config else 0.0
+    clock = _clock()
+    key = (
+        "status", p["name"], label, snap.exchange, snap.network, snap.trigger,
+        snap.investment, snap.is_isolated, type(summary), astuple(summary), clock,
+    )
+    cached = _cached_card(key)
+    if cached is not None:
+        return cached
 
-    if isinstance(state.summary, SpotGridSummary):
-        img = _render_spot_status_card(
-            label, exchange, network, state.summary, trigger, investment, p,
-        )
-    elif isinstance(state.summary, PerpGridSummary):
-        is_isolated = state.config.is_isolated if state.config else False
-        img = _render_perp_status_card(
-            label, exchange, network, state.summary,
-            trigger, investment, is_isolated, p,
-        )
-    else:
-        raise ValueError(f"Unknown summary type for {label!r}: {type(state.summary)}")
+    img = renderer(label, snap, clock, p)
 
-    buf = io.BytesIO()
-    img.save(buf, format="PNG", optimize=True)
-    buf.seek(0)
-    return buf
+    return _store_card(key, img)
+
+
+# ---------------------------------------------------------------------------
+# Cache warm-up
+# ---------------------------------------------------------------------------
+
+_HERO_CHARS = "0123456789+-$,."
+
+
+def warm_up(theme: str = "light") -> None:
+    """Load fonts and build every template for theme ahead of the first card.
+
+    Call from a worker thread at startup so the first /status or periodic
+    tick does not pay for font loading and chrome rasterization.
+    """
+    p = _DARK_PAL if theme == "dark" else _LIGHT_PAL
+    for perp in (False, True):
+        _status_template(perp, p)
+    for positive in (True, False):
+        _periodic_template(theme, positive)
+    hero = _periodic_fonts()["hero"]
+    for char in _HERO_CHARS:
+        _glyph(char, hero)
@@ -63,11 +63,13 @@ class ReportingConfig(BaseModel):
     error_cooldown_seconds: int = 60
     startup_notification: bool = True
     card_theme: Literal["dark", "light", "text"] = "light"
+    archive_after_minutes: int = 0  # 0 = never archive silent bots
 
 
 class ConnectionConfig(BaseModel):
     reconnect_delay_seconds: int = 5
     max_reconnect_delay_seconds: int = 60
+    reconnect_jitter_seconds: float = 2.0
     ping_interval_seconds: int = 30
 
 
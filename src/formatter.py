@@ -7,6 +7,8 @@ Two message styles:
 
 from __future__ import annotations
 
+from typing import Callable
+
 from .bot_state import BotState
 from .models import PerpGridSummary, SpotGridSummary
 
@@ -134,29 +136,49 @@ def format_periodic_update(label: str, state: BotState) -> str | None:
         return None  # no data yet, skip
 
     s = state.summary
-    new_trades = s.roundtrips - state.prev_roundtrips
-    matched_delta = s.matched_profit - state.prev_matched_profit
-    fees_delta = s.total_fees - state.prev_total_fees
+    new_trades, matched_delta, fees_delta = state.period_deltas()
     net_earned = matched_delta - fees_delta
 
     net_sign = "+" if net_earned >= 0 else ""
 
     if isinstance(s, SpotGridSummary):
-        return (
-            f"<b>{label}</b>  {s.symbol}\n"
-            f"  trades +{new_trades}  ·  "
-            f"earned {net_sign}{net_earned:.2f}  "
-            f"(matched {matched_delta:+.2f}, fees {fees_delta:.2f})"
-        )
+        key: tuple = (SpotGridSummary, label, s.symbol)
     elif isinstance(s, PerpGridSummary):
-        return (
-            f"<b>{label}</b>  {s.symbol} {s.grid_bias} {s.leverage}x\n"
-            f"  trades +{new_trades}  ·  "
-            f"earned {net_sign}{net_earned:.2f}  "
-            f"(matched {matched_delta:+.2f}, fees {fees_delta:.2f})"
-        )
-
-    return None
+        key = (PerpGridSummary, label, s.symbol, s.grid_bias, s.leverage)
+    else:
+        return None
+
+    if state.report_template is None or state.report_template_key != key:
+        state.report_template = _periodic_template(label, s)
+        state.report_template_key = key
+
+    return state.report_template(
+        new_trades=new_trades,
+        net_sign=net_sign,
+        net_earned=net_earned,
+        matched_delta=matched_delta,
+        fees_delta=fees_delta,
+    )
+
+
+def _periodic_template(
+    label: str, s: SpotGridSummary | PerpGridSummary
+) -> Callable[..., str]:
+    """Pre-render the constant header of a bot's periodic update.
+
+    Returns a bound ``str.format`` taking only the per-tick delta values.
+    """
+    if isinstance(s, PerpGridSummary):
+        header = f"<b>{label}</b>  {s.symbol} {s.grid_bias} {s.leverage}x"
+    else:
+        header = f"<b>{label}</b>  {s.symbol}"
+    header = header.replace("{", "{{").replace("}", "}}")
+    return (
+        header + "\n"
+        "  trades +{new_trades}  ·  "
+        "earned {net_sign}{net_earned:.2f}  "
+        "(matched {matched_delta:+.2f}, fees {fees_delta:.2f})"
+    ).format
 
 
 # ---------------------------------------------------------------------------
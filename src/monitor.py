@@ -8,11 +8,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
 from .bot_state import BotState
-from .config import DaemonConfig
+from .config import BotEndpoint, DaemonConfig
 from .models import (
     PerpGridSummary,
     SpotGridSummary,
@@ -26,6 +27,9 @@ from .ws_client import BotWebSocketClient
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on waiting for child tasks to unwind during shutdown
+SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
 
 class Monitor:
     """Orchestrates WebSocket clients and manages bot state."""
@@ -34,8 +38,14 @@ class Monitor:
         self._config = config
         self._telegram = telegram
         self.bots: dict[str, BotState] = {}
-        self._clients: list[BotWebSocketClient] = []
+        self._clients: dict[str, BotWebSocketClient] = {}
+        self._client_tasks: dict[str, asyncio.Task] = {}
+        self.tasks: list[asyncio.Task] = []  # WS client + reporter tasks
         self._error_cooldowns: dict[str, datetime] = {}
+        # Labels whose summary changed since the last periodic snapshot
+        self._dirty: set[str] = set()
+        # Set by stop(); run() stops waiting on children once it fires
+        self._stop_requested = asyncio.Event()
 
     def get_all_states(self) -> dict[str, BotState]:
         """Return all bot states (used by Telegram /status command)."""
@@ -43,41 +53,124 @@ class Monitor:
 
     async def run(self) -> None:
         """Start all WS clients and the periodic reporter as concurrent tasks."""
-        tasks: list[asyncio.Task] = []
-
-        # Create a client for each configured bot
+        # Register every bot first, then open all connections at once so the
+        # handshakes overlap instead of waiting on one another.
         for endpoint in self._config.bots:
             state = BotState(label=endpoint.label, url=endpoint.url)
-            self.bots[endpoint.label] = state
-
-            client = BotWebSocketClient(
-                label=endpoint.label,
-                url=endpoint.url,
-                on_event=self._handle_event,
-                on_connect=self._handle_connect,
-                on_disconnect=self._handle_disconnect,
-                connection_config=self._config.connection,
-            )
-            self._clients.append(client)
-            tasks.append(asyncio.create_task(client.run()))
+            self.bots[state.label] = state
+        self.tasks = [self._start_client(endpoint) for endpoint in self._config.bots]
 
         # Start periodic reporting if enabled
         interval = self._config.reporting.periodic_interval_minutes
         if interval > 0:
-            tasks.append(asyncio.create_task(self._periodic_report_loop()))
+            self.tasks.append(
+                asyncio.create_task(self._periodic_report_loop(), name="reporter")
+            )
 
         # Startup notification (lightweight — full summary sent once data arrives)
         if self._config.reporting.startup_notification:
             labels = [b.label for b in self._config.bots]
             await self._telegram.send_startup_message(labels)
 
-        # Wait for all tasks (they run forever until stopped)
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Wait for all tasks (they run forever until stopped); loop again if a
+        # reload added tasks meanwhile. On cancel or error the children are
+        # cancelled and joined here; after stop(), stop() owns the join.
+        stop_wait = asyncio.create_task(self._stop_requested.wait())
+        try:
+            while not stop_wait.done():
+                pending = [task for task in self.tasks if not task.done()]
+                if not pending:
+                    break
+                await asyncio.wait(
+                    [*pending, stop_wait], return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            stop_wait.cancel()
+            for task in self.tasks:
+                task.cancel()
+            if not self._stop_requested.is_set():
+                await self._join_tasks(SHUTDOWN_TIMEOUT_SECONDS)
+
+    def _start_client(self, endpoint: BotEndpoint) -> asyncio.Task:
+        """Create the WS client for one bot and start its connect loop."""
+        state = self.bots[endpoint.label]
+        client = BotWebSocketClient(
+            label=state.label,
+            url=state.url,
+            on_event=self._handle_event,
+            on_connect=self._handle_connect,
+            on_disconnect=self._handle_disconnect,
+            connection_config=self._config.connection,
+        )
+        task = asyncio.create_task(client.run(), name=f"ws-{state.label}")
+        self._clients[state.label] = client
+        self._client_tasks[state.label] = task
+        return task
+
+    async def reload_bots(self, endpoints: list[BotEndpoint]) -> None:
+        """Apply a new bot list: start added bots and stop removed ones.
+
+        Bots whose label and URL are unchanged keep their connection and state;
+        a changed URL counts as remove + add.
+        """
+        wanted = {endpoint.label: endpoint for endpoint in endpoints}
+        removed = [
+            label
+            for label, state in self.bots.items()
+            if label not in wanted or wanted[label].url != state.url
+        ]
+        for label in removed:
+            await self._remove_bot(label)
+
+        added = [endpoint for endpoint in endpoints if endpoint.label not in self.bots]
+        for endpoint in added:
+            state = BotState(label=endpoint.label, url=endpoint.url)
+            self.bots[state.label] = state
+            self.tasks.append(self._start_client(endpoint))
 
-    async def stop(self) -> None:
-        """Stop all WebSocket clients."""
-        for client in self._clients:
+        self._config.bots = list(endpoints)
+        logger.info(
+            "Bot list reloaded: %d added, %d removed", len(added), len(removed)
+        )
+
+    async def _remove_bot(self, label: str) -> None:
+        """Stop one bot's WS client and drop all of its cached state."""
+        client = self._clients.pop(label, None)
+        task = self._client_tasks.pop(label, None)
+        if client is not None:
+            await client.stop()
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            self.tasks.remove(task)
+        self.bots.pop(label, None)
+        self._dirty.discard(label)
+        self._error_cooldowns.pop(label, None)
+
+    async def stop(self, timeout: float = SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Stop all WebSocket clients, then cancel and join child tasks.
+
+        Waits at most ``timeout`` seconds for the tasks to unwind; tasks still
+        running after that are logged and abandoned, never awaited again.
+        """
+        self._stop_requested.set()
+        for client in self._clients.values():
             await client.stop()
+        for task in self.tasks:
+            task.cancel()
+        await self._join_tasks(timeout)
+
+    async def _join_tasks(self, timeout: float) -> None:
+        """Wait up to timeout for child tasks to finish; log any stragglers."""
+        if not self.tasks:
+            return
+        _, pending = await asyncio.wait(self.tasks, timeout=timeout)
+        if pending:
+            logger.warning(
+                "Monitor tasks did not stop within %gs, abandoning: %s",
+                timeout,
+                ", ".join(sorted(task.get_name() for task in pending)),
+            )
 
     # --- Event Handlers ---
 
@@ -90,22 +183,33 @@ class Monitor:
             return
 
         try:
+            # info/config are replayed on every (re)connect; keep the cached
+            # objects when the payload is unchanged
             if event_type == "info":
-                state.info = parse_system_info(data)
+                info = state.info
+                if info is None or (info.network, info.exchange) != (
+                    data.get("network"), data.get("exchange")
+                ):
+                    state.info = parse_system_info(data)
             elif event_type == "config":
-                state.config = parse_strategy_config(data)
+                if state.config is None or state.config.raw != data:
+                    state.config = parse_strategy_config(data)
             elif event_type == "spot_grid_summary":
                 state.summary = parse_spot_grid_summary(data)
-                state.last_summary_at = datetime.now()
+                state.last_summary_at = time.monotonic()
+                state.lifecycle = "activated"
+                self._dirty.add(label)
                 await self._maybe_send_initial_summary(state)
             elif event_type == "perp_grid_summary":
                 state.summary = parse_perp_grid_summary(data)
-                state.last_summary_at = datetime.now()
+                state.last_summary_at = time.monotonic()
+                state.lifecycle = "activated"
+                self._dirty.add(label)
                 await self._maybe_send_initial_summary(state)
             elif event_type == "error":
                 error_msg = data if isinstance(data, str) else str(data)
                 state.last_error = error_msg
-                state.last_error_at = datetime.now()
+                state.last_error_at = time.monotonic()
                 await self._maybe_send_error_alert(label, error_msg)
             # market_update, order_update, grid_state: ignored (not needed)
         except Exception as e:
@@ -118,7 +222,7 @@ class Monitor:
         state = self.bots.get(label)
         if state:
             state.connected = True
-            state.last_connected_at = datetime.now()
+            state.last_connected_at = time.monotonic()
             logger.info("Bot %s connected", label)
 
     async def _handle_disconnect(self, label: str) -> None:
@@ -170,16 +274,46 @@ class Monitor:
         interval = self._config.reporting.periodic_interval_minutes * 60
         while True:
             await asyncio.sleep(interval)
+            self._update_lifecycles()
+            active = {
+                label: state
+                for label, state in self.bots.items()
+                if state.lifecycle != "archived"
+            }
             logger.info("Sending periodic update...")
-            await self._telegram.send_periodic_update(self.bots)
-            # Snapshot for next delta
-            for state in self.bots.values():
+            await self._telegram.send_periodic_update(active)
+            self._snapshot_dirty()
+
+    def _update_lifecycles(self) -> None:
+        """Demote bots with no new summary since the last report tick."""
+        now = time.monotonic()
+        archive_after = self._config.reporting.archive_after_minutes
+        ttl = archive_after * 60
+        for label, state in self.bots.items():
+            if label in self._dirty:
+                continue
+            if state.lifecycle == "activated":
+                state.lifecycle = "merged"
+            if (
+                archive_after > 0
+                and state.lifecycle == "merged"
+                and state.last_summary_at is not None
+                and now - state.last_summary_at > ttl
+            ):
+                state.lifecycle = "archived"
+                logger.info("Bot %s archived (no summary for %dm)", label, archive_after)
+
+    def _snapshot_dirty(self) -> None:
+        """Snapshot only bots whose summary changed since the last report."""
+        dirty, self._dirty = self._dirty, set()
+        for label in dirty:
+            state = self.bots.get(label)
+            if state is not None:
                 _snapshot_state(state)
 
 
 def _snapshot_state(state: BotState) -> None:
     """Save current values for computing deltas in the next interval."""
-    if state.summary is not None:
-        state.prev_roundtrips = state.summary.roundtrips
-        state.prev_matched_profit = state.summary.matched_profit
-        state.prev_total_fees = state.summary.total_fees
+    s = state.summary
+    if s is not None:
+        state.prev_snapshot = (s.roundtrips, s.matched_profit, s.total_fees)
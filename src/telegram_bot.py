@@ -6,15 +6,24 @@ a sender interface for the Monitor to push updates.
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
+import time
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from telegram import Update
 from telegram.constants import ParseMode
 from telegram.ext import Application, CommandHandler, ContextTypes
+from telegram.request import HTTPXRequest
 
-from .card_renderer import build_periodic_card, build_status_card
+from .card_renderer import (
+    build_periodic_card,
+    build_status_card,
+    card_snapshot,
+    warm_up,
+)
 from .config import TelegramConfig
 from .formatter import (
     format_bot_status,
@@ -31,6 +40,41 @@ logger = logging.getLogger(__name__)
 # Telegram message length limit
 MAX_MESSAGE_LENGTH = 4096
 
+# Shared keep-alive connection pool for Bot API calls
+CONNECTION_POOL_SIZE = 20
+REQUEST_TIMEOUT_SECONDS = 30.0
+
+# How long outbound text waits in the buffer before being coalesced and sent
+FLUSH_INTERVAL_SECONDS = 2.0
+
+# Bot API limits: ~30 messages/s overall, ~1 message/s per chat
+GLOBAL_SENDS_PER_SECOND = 30
+CHAT_SENDS_PER_SECOND = 1
+
+
+class _TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._rate, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
 
 class TelegramBot:
     """Telegram bot with command handlers and message sending capabilities."""
@@ -39,7 +83,28 @@ class TelegramBot:
         self._chat_id = int(config.chat_id)
         self._card_theme = card_theme
         self._monitor = None  # Set via set_monitor() to break circular dep
-        self._app = Application.builder().token(config.bot_token).build()
+        # Outbound text buffer — merged into one message per flush
+        self._pending: list[str] = []
+        self._pending_len = 0
+        self._flush_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        # Pre-emptive throttling so bursts queue locally instead of hitting 429s
+        self._global_limiter = _TokenBucket(GLOBAL_SENDS_PER_SECOND)
+        self._chat_limiters: defaultdict[int, _TokenBucket] = defaultdict(
+            lambda: _TokenBucket(CHAT_SENDS_PER_SECOND)
+        )
+        # One pooled httpx client for all sends; closed by Application.shutdown()
+        self._http = HTTPXRequest(
+            connection_pool_size=CONNECTION_POOL_SIZE,
+            read_timeout=REQUEST_TIMEOUT_SECONDS,
+            write_timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        self._app = (
+            Application.builder()
+            .token(config.bot_token)
+            .request(self._http)
+            .build()
+        )
         self._app.add_handler(CommandHandler("status", self._cmd_status))
         self._app.add_handler(CommandHandler("help", self._cmd_help))
 
@@ -49,13 +114,25 @@ class TelegramBot:
 
     async def start(self) -> None:
         """Start the Telegram bot polling loop."""
+        if self._card_theme != "text":
+            await asyncio.to_thread(warm_up, self._card_theme)
         await self._app.initialize()
         await self._app.start()
         await self._app.updater.start_polling()
+        self._flush_task = asyncio.create_task(self._flush_loop())
         logger.info("Telegram bot polling started")
 
     async def stop(self) -> None:
-        """Stop the Telegram bot."""
+        """Drain buffered messages, then stop the Telegram bot."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
         try:
             await self._app.updater.stop()
             await self._app.stop()
@@ -88,7 +165,8 @@ class TelegramBot:
             if not states:
                 await self._send_safe(chat_id, "no bots configured")
             else:
-                for lbl, st in states.items():
+                # Copy first: a reload can add or drop bots while we await sends
+                for lbl, st in list(states.items()):
                     await self._send_status_card(chat_id, lbl, st)
 
     async def _send_status_card(self, chat_id: int, label: str, state: "BotState") -> None:
@@ -106,7 +184,11 @@ class TelegramBot:
             return
 
         try:
-            image_buf = build_status_card(label, state, theme=self._card_theme)
+            # Render off the event loop so WS consumers keep running; the
+            # snapshot is taken here so the worker never reads live state
+            image_buf = await asyncio.to_thread(
+                build_status_card, label, card_snapshot(state), theme=self._card_theme
+            )
             await self._send_photo(chat_id, image_buf)
         except Exception as e:
             logger.warning("Status card render failed for %s: %s — falling back to text", label, e)
@@ -132,15 +214,16 @@ class TelegramBot:
     async def send_startup_message(self, labels: list[str]) -> None:
         """Send lightweight startup notification."""
         msg = format_startup_message(labels)
-        await self._send_safe(self._chat_id, msg)
+        await self.enqueue(msg)
 
     async def send_initial_summary(self, label: str, state: BotState) -> None:
         """Send full summary when a bot first reports data."""
         await self._send_status_card(self._chat_id, label, state)
 
     async def send_error_alert(self, label: str, error_msg: str) -> None:
-        """Send an immediate error alert."""
+        """Send an error alert now, as its own message, bypassing the buffer."""
         msg = format_error_alert(label, error_msg)
+        await self.flush()  # keep earlier buffered text ahead of the alert
         await self._send_safe(self._chat_id, msg)
 
     async def send_periodic_update(
@@ -156,7 +239,7 @@ class TelegramBot:
     async def _send_periodic_card(self, label: str, state: "BotState") -> None:
         """Send one bot's periodic update as an image card with text fallback."""
         if not state.connected:
-            await self._send_safe(self._chat_id, f"{label} — disconnected")
+            await self.enqueue(f"{label} — disconnected")
             return
 
         if state.summary is None:
@@ -165,30 +248,71 @@ class TelegramBot:
         if self._card_theme == "text":
             fallback = format_periodic_update(label, state)
             if fallback:
-                await self._send_safe(self._chat_id, fallback)
+                await self.enqueue(fallback)
             return
 
         try:
-            image_buf = build_periodic_card(label, state, theme=self._card_theme)
+            image_buf = await asyncio.to_thread(
+                build_periodic_card, label, card_snapshot(state), theme=self._card_theme
+            )
             await self._send_photo(self._chat_id, image_buf)
         except Exception as e:
             logger.warning("Card render failed for %s: %s — falling back to text", label, e)
             fallback = format_periodic_update(label, state)
             if fallback:
-                await self._send_safe(self._chat_id, fallback)
+                await self.enqueue(fallback)
 
     async def _send_photo(self, chat_id: int, image_buf: io.BytesIO) -> None:
         """Send a PNG image to a Telegram chat."""
+        if chat_id == self._chat_id:
+            await self.flush()  # keep buffered text ahead of the image
+        await self._throttle(chat_id)
         try:
             await self._app.bot.send_photo(chat_id=chat_id, photo=image_buf)
         except Exception as e:
             logger.error("Failed to send Telegram photo: %s", e)
 
+    # --- Outbound Buffer ---
+
+    async def enqueue(self, text: str) -> None:
+        """Buffer a message for the monitored chat; sent on the next flush.
+
+        Flushes immediately once the buffer would fill a whole Telegram message.
+        """
+        async with self._lock:
+            self._pending.append(text)
+            self._pending_len += len(text) + 2
+            full = self._pending_len >= MAX_MESSAGE_LENGTH
+        if full:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send all buffered messages as one (split if over the limit)."""
+        async with self._lock:
+            if not self._pending:
+                return
+            text = "\n\n".join(self._pending)
+            self._pending.clear()
+            self._pending_len = 0
+        await self._send_safe(self._chat_id, text)
+
+    async def _flush_loop(self) -> None:
+        """Periodically flush the outbound buffer."""
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            await self.flush()
+
     # --- Internal Helpers ---
 
+    async def _throttle(self, chat_id: int) -> None:
+        """Wait for both the global and the per-chat send budget."""
+        await self._global_limiter.acquire()
+        await self._chat_limiters[chat_id].acquire()
+
     async def _send_safe(self, chat_id: int, text: str) -> None:
         """Send a message, splitting if it exceeds Telegram's limit."""
         if len(text) <= MAX_MESSAGE_LENGTH:
+            await self._throttle(chat_id)
             try:
                 await self._app.bot.send_message(
                     chat_id, text, parse_mode=ParseMode.HTML
@@ -198,6 +322,7 @@ class TelegramBot:
         else:
             chunks = self._split_message(text)
             for chunk in chunks:
+                await self._throttle(chat_id)
                 try:
                     await self._app.bot.send_message(
                         chat_id, chunk, parse_mode=ParseMode.HTML
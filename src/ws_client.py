@@ -2,6 +2,9 @@
 
 Connects to a bot's WebSocket server, receives JSON events, and dispatches
 them to a callback. Handles reconnection with exponential backoff.
+
+Received events go through a per-connection queue; the consumer drains it in
+batches and drops summaries superseded by a newer one in the same batch.
 """
 
 from __future__ import annotations
@@ -9,6 +12,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 from typing import Any, Awaitable, Callable
 
 import websockets
@@ -16,8 +20,35 @@ from websockets.exceptions import ConnectionClosed
 
 from .config import ConnectionConfig
 
+try:  # optional C-accelerated decoder; falls back to the stdlib
+    import orjson
+
+    _json_loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Max received-but-undispatched events per connection (receiver waits when full)
+EVENT_QUEUE_SIZE = 256
+
+# Events whose payload fully replaces the previous one — only the newest in a
+# batch needs dispatching
+COALESCED_EVENTS = frozenset({"spot_grid_summary", "perp_grid_summary"})
+
+
+def coalesce_events(events: list[tuple[str, Any]]) -> list[tuple[str, Any]]:
+    """Drop summary events superseded by a later one of the same type.
+
+    All other events are kept, and relative order is preserved.
+    """
+    last = {etype: i for i, (etype, _) in enumerate(events) if etype in COALESCED_EVENTS}
+    return [
+        event
+        for i, event in enumerate(events)
+        if event[0] not in COALESCED_EVENTS or last[event[0]] == i
+    ]
+
 
 class BotWebSocketClient:
     """WebSocket client for a single bot endpoint."""
@@ -37,7 +68,7 @@ class BotWebSocketClient:
         self._on_connect = on_connect
         self._on_disconnect = on_disconnect
         self._config = connection_config
-        self._delay = connection_config.reconnect_delay_seconds
+        self._attempt = 0  # consecutive failed connections, drives backoff
         self._stopped = False
 
     async def run(self) -> None:
@@ -53,23 +84,10 @@ class BotWebSocketClient:
                     ping_timeout=20,
                 ) as ws:
                     # Reset backoff on successful connection
-                    self._delay = self._config.reconnect_delay_seconds
+                    self._attempt = 0
                     await self._on_connect(self.label)
                     logger.info("Connected to %s", self.label)
-
-                    async for raw_message in ws:
-                        if self._stopped:
-                            break
-                        try:
-                            msg = json.loads(raw_message)
-                            event_type = msg.get("event_type")
-                            data = msg.get("data")
-                            if event_type and data is not None:
-                                await self._on_event(self.label, event_type, data)
-                        except json.JSONDecodeError as e:
-                            logger.warning(
-                                "Invalid JSON from %s: %s", self.label, e
-                            )
+                    await self._pump(ws)
 
             except (ConnectionClosed, ConnectionError, OSError) as e:
                 logger.warning(
@@ -83,16 +101,98 @@ class BotWebSocketClient:
             # Notify disconnect and wait before reconnecting
             if not self._stopped:
                 await self._on_disconnect(self.label)
+                delay = self._backoff()
+                self._attempt += 1
                 logger.info(
-                    "Reconnecting to %s in %ds...", self.label, self._delay
+                    "Reconnecting to %s in %.1fs...", self.label, delay
                 )
-                await asyncio.sleep(self._delay)
-                # Exponential backoff capped at max
-                self._delay = min(
-                    self._delay * 2,
-                    self._config.max_reconnect_delay_seconds,
+                await asyncio.sleep(delay)
+
+    async def _pump(self, ws: Any) -> None:
+        """Receive from ws and dispatch events until either side ends.
+
+        A failing consumer stops the receiver and its error is raised, so the
+        run loop reconnects instead of blocking on a full queue. When the
+        receiver ends first, what was already queued is dispatched before the
+        receiver's error (if any) is raised.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        consumer = asyncio.create_task(self._consume(queue))
+        receiver = asyncio.create_task(self._receive(ws, queue))
+        try:
+            await asyncio.wait(
+                {receiver, consumer}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if consumer.done():
+                # _consume only returns after the sentinel, so it failed
+                receiver.cancel()
+                await asyncio.gather(receiver, return_exceptions=True)
+                consumer.result()
+            else:
+                await self._finish_consumer(queue, consumer)
+                receiver.result()
+                consumer.result()
+        finally:
+            receiver.cancel()
+            consumer.cancel()
+            await asyncio.gather(receiver, consumer, return_exceptions=True)
+
+    async def _finish_consumer(
+        self, queue: asyncio.Queue, consumer: asyncio.Task
+    ) -> None:
+        """Queue the sentinel and wait for consumer to drain the backlog.
+
+        Gives up on the put if the consumer fails first, so a full queue with
+        no reader never blocks.
+        """
+        put = asyncio.create_task(queue.put(None))
+        try:
+            await asyncio.wait({put, consumer}, return_when=asyncio.FIRST_COMPLETED)
+            if put.done():
+                await asyncio.wait({consumer})
+        finally:
+            put.cancel()
+
+    def _backoff(self) -> float:
+        """Exponential backoff capped at max, plus random jitter.
+
+        The jitter spreads out reconnects when many bots drop at once.
+        """
+        delay = min(
+            self._config.reconnect_delay_seconds * 2 ** self._attempt,
+            self._config.max_reconnect_delay_seconds,
+        )
+        return delay + random.uniform(0, self._config.reconnect_jitter_seconds)
+
+    async def _receive(self, ws: Any, queue: asyncio.Queue) -> None:
+        """Decode incoming messages and queue them for dispatch."""
+        async for raw_message in ws:
+            if self._stopped:
+                break
+            try:
+                msg = _json_loads(raw_message)
+                event_type = msg.get("event_type")
+                data = msg.get("data")
+                if event_type and data is not None:
+                    await queue.put((event_type, data))
+            except json.JSONDecodeError as e:  # orjson's error subclasses this
+                logger.warning(
+                    "Invalid JSON from %s: %s", self.label, e
                 )
 
+    async def _consume(self, queue: asyncio.Queue) -> None:
+        """Dispatch queued events in batches until the None sentinel."""
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            done = batch[-1] is None
+            events = [event for event in batch if event is not None]
+            for event_type, data in coalesce_events(events):
+                await self._on_event(self.label, event_type, data)
+            if done:
+                return
+
     async def stop(self) -> None:
         """Signal the client to stop."""
         self._stopped = True
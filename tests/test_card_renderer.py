@@ -4,12 +4,78 @@ from __future__ import annotations
 
 import io
 import os
+from unittest.mock import patch
 
 import pytest
-from PIL import Image
+from PIL import Image, ImageDraw
 
+from src import card_renderer
 from src.bot_state import BotState
-from src.card_renderer import _LS_W, _PC_H, _PC_W, build_periodic_card, build_status_card
+from src.card_renderer import (
+    _LIGHT_PAL,
+    _LS_W,
+    _PC_H,
+    _PC_W,
+    _clock,
+    _fp,
+    _periodic_fonts,
+    _status_template,
+    _text,
+    _text_glyphs,
+    build_periodic_card,
+    build_status_card,
+    card_snapshot,
+)
+
+
+class TestCardPriceFormat:
+    def test_thousands_drop_zero_cents(self) -> None:
+        assert _fp(1000.0) == "1,000"
+        assert _fp(3500.5) == "3,500.50"
+
+    def test_cents_round_up_into_whole(self) -> None:
+        assert _fp(1999.996) == "2,000"
+
+    def test_small_values(self) -> None:
+        assert _fp(12.345) == "12.35"
+        assert _fp(0.5) == "0.500"
+
+
+class TestClock:
+    def test_labels_follow_the_minute(self) -> None:
+        from datetime import datetime
+
+        base = datetime(2026, 3, 14, 9, 26, 5).timestamp()
+        with patch.object(card_renderer.time, "time", return_value=base):
+            first = _clock()
+        with patch.object(card_renderer.time, "time", return_value=base + 50):
+            assert _clock() is first
+        with patch.object(card_renderer.time, "time", return_value=base + 60):
+            assert _clock() == ("09:27", "Mar 14", "09:27  Mar 14")
+        assert first == ("09:26", "Mar 14", "09:26  Mar 14")
+
+
+class TestTextGlyphs:
+    def test_matches_direct_text_rendering(self) -> None:
+        font = _periodic_fonts()["hero"]
+        for text in ("+$1,234.56", "-$0.42", "+$100,000.75"):
+            expected = Image.new("RGB", (_PC_W, 120), (240, 253, 244))
+            actual = expected.copy()
+            _text(ImageDraw.Draw(expected), 34, 20, text, font, (22, 163, 74))
+            _text_glyphs(actual, 34, 20, text, font, (22, 163, 74))
+            assert actual.tobytes() == expected.tobytes(), text
+
+
+class TestCardSnapshot:
+    def test_snapshot_is_detached_from_live_state(self, connected_spot_state: BotState) -> None:
+        snap = card_snapshot(connected_spot_state)
+        first = build_status_card("Snap-Spot", snap).read()
+        connected_spot_state.summary.roundtrips += 1  # type: ignore[union-attr]
+        connected_spot_state.info = None
+        connected_spot_state.prev_snapshot = (1, 1.0, 1.0)
+        assert build_status_card("Snap-Spot", snap).read() == first
+        assert snap.exchange == "hyperliquid"
+        assert snap.prev_snapshot == (0, 0.0, 0.0)
 
 
 class TestPeriodicCardSmoke:
@@ -32,9 +98,7 @@ class TestPeriodicCardSmoke:
         assert img.mode == "RGB"
 
     def test_periodic_card_with_deltas(self, connected_spot_state: BotState) -> None:
-        connected_spot_state.prev_roundtrips = 10
-        connected_spot_state.prev_matched_profit = 30.0
-        connected_spot_state.prev_total_fees = 1.5
+        connected_spot_state.prev_snapshot = (10, 30.0, 1.5)
         buf = build_periodic_card("Delta-Spot", connected_spot_state)
         img = Image.open(buf)
         assert img.size == (_PC_W, _PC_H)
@@ -52,9 +116,7 @@ class TestPeriodicCardSmoke:
             pytest.skip("Set SAVE_TEST_CARDS=1 to enable visual output")
 
         for label, state in [("spot", connected_spot_state), ("perp", connected_perp_state)]:
-            state.prev_roundtrips = 5
-            state.prev_matched_profit = 20.0
-            state.prev_total_fees = 1.0
+            state.prev_snapshot = (5, 20.0, 1.0)
             buf = build_periodic_card(f"Periodic-{label.upper()}", state)
             out_path = tmp_path / f"periodic_{label}.png"
             out_path.write_bytes(buf.read())
@@ -104,6 +166,32 @@ class TestStatusCardSmoke:
         with pytest.raises(ValueError, match="No summary data"):
             build_status_card("X", state)
 
+    def test_raises_on_unknown_summary_type(self) -> None:
+        state = BotState(label="X", url="ws://x", connected=True, summary=object())  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="Unknown summary type"):
+            build_status_card("X", state)
+
+    def test_repeat_render_served_from_cache(self, connected_spot_state: BotState) -> None:
+        first = build_status_card("Cache-Spot", connected_spot_state).read()
+        with patch.object(card_renderer, "_render_spot_status_card") as render:
+            second = build_status_card("Cache-Spot", connected_spot_state).read()
+        render.assert_not_called()
+        assert second == first
+
+    def test_changed_summary_rerenders(self, connected_spot_state: BotState) -> None:
+        first = build_status_card("Cache-Spot", connected_spot_state).read()
+        connected_spot_state.summary.roundtrips += 1  # type: ignore[union-attr]
+        second = build_status_card("Cache-Spot", connected_spot_state).read()
+        assert second != first
+
+    def test_render_does_not_touch_template(self, connected_spot_state: BotState) -> None:
+        template = _status_template(False, _LIGHT_PAL)
+        before = template.tobytes()
+        buf = build_status_card("Test-Spot", connected_spot_state)
+        assert Image.open(buf).size == template.size
+        assert _status_template(False, _LIGHT_PAL) is template
+        assert template.tobytes() == before
+
     def test_spot_card_negative_pnl(self, connected_spot_state: BotState) -> None:
         connected_spot_state.summary.total_profit = -42.50  # type: ignore[union-attr]
         connected_spot_state.summary.matched_profit = -38.00  # type: ignore[union-attr]
@@ -162,9 +250,7 @@ class TestLightPeriodicCardSmoke:
         assert img.size[0] == _PC_W
 
     def test_light_periodic_card_with_deltas(self, connected_spot_state: BotState) -> None:
-        connected_spot_state.prev_roundtrips = 10
-        connected_spot_state.prev_matched_profit = 30.0
-        connected_spot_state.prev_total_fees = 1.5
+        connected_spot_state.prev_snapshot = (10, 30.0, 1.5)
         buf = build_periodic_card("Delta-Spot", connected_spot_state, theme="light")
         img = Image.open(buf)
         assert img.size == (_PC_W, _PC_H)
@@ -183,9 +269,7 @@ class TestLightPeriodicCardSmoke:
             pytest.skip("Set SAVE_TEST_CARDS=1 to enable visual output")
 
         for label, state in [("spot", connected_spot_state), ("perp", connected_perp_state)]:
-            state.prev_roundtrips = 5
-            state.prev_matched_profit = 20.0
-            state.prev_total_fees = 1.0
+            state.prev_snapshot = (5, 20.0, 1.0)
             # Light variant
             buf = build_periodic_card(f"Periodic-{label.upper()}", state, theme="light")
             out_path = tmp_path / f"periodic_light_{label}.png"
@@ -196,3 +280,25 @@ class TestLightPeriodicCardSmoke:
             out_path = tmp_path / f"periodic_dark_{label}.png"
             out_path.write_bytes(buf.read())
             print(f"Saved dark periodic {label} card to {out_path}")
+
+
+class TestWarmUp:
+    def test_builds_status_templates_for_theme(self) -> None:
+        card_renderer.warm_up("light")
+        assert (False, "light") in card_renderer._STATUS_TEMPLATE_CACHE
+        assert (True, "light") in card_renderer._STATUS_TEMPLATE_CACHE
+
+    def test_builds_periodic_templates_for_theme(self) -> None:
+        card_renderer.warm_up("light")
+        assert ("light", True) in card_renderer._PERIODIC_TEMPLATE_CACHE
+        assert ("light", False) in card_renderer._PERIODIC_TEMPLATE_CACHE
+
+    def test_prerasterizes_hero_glyphs(self) -> None:
+        card_renderer.warm_up("dark")
+        hero = _periodic_fonts()["hero"]
+        before = card_renderer._glyph.cache_info()
+        for char in card_renderer._HERO_CHARS:
+            card_renderer._glyph(char, hero)
+        after = card_renderer._glyph.cache_info()
+        assert after.misses == before.misses
+        assert after.hits - before.hits == len(card_renderer._HERO_CHARS)
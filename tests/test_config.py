@@ -53,8 +53,10 @@ class TestConfigLoading:
         assert config.reporting.periodic_interval_minutes == 60
         assert config.reporting.error_cooldown_seconds == 60
         assert config.reporting.startup_notification is True
+        assert config.reporting.archive_after_minutes == 0
         assert config.connection.reconnect_delay_seconds == 5
         assert config.connection.max_reconnect_delay_seconds == 60
+        assert config.connection.reconnect_jitter_seconds == 2.0
         assert config.connection.ping_interval_seconds == 30
 
     def test_full_config(self, tmp_path: Path) -> None:
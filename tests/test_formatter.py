@@ -101,9 +101,7 @@ class TestFormatPeriodicUpdate:
 
     def test_spot_update_with_deltas(self, connected_spot_state: BotState) -> None:
         # Simulate: prev had 10 trades, $30 matched, $2 fees
-        connected_spot_state.prev_roundtrips = 10
-        connected_spot_state.prev_matched_profit = 30.0
-        connected_spot_state.prev_total_fees = 2.0
+        connected_spot_state.prev_snapshot = (10, 30.0, 2.0)
         # Current: 12 trades, $45.23 matched, $3.12 fees
         result = format_periodic_update("Test-Spot", connected_spot_state)
         assert result is not None
@@ -114,9 +112,7 @@ class TestFormatPeriodicUpdate:
         assert "fees" in result
 
     def test_perp_update_with_deltas(self, connected_perp_state: BotState) -> None:
-        connected_perp_state.prev_roundtrips = 5
-        connected_perp_state.prev_matched_profit = 80.0
-        connected_perp_state.prev_total_fees = 5.0
+        connected_perp_state.prev_snapshot = (5, 80.0, 5.0)
         # Current: 8 trades, $120.50 matched, $8.30 fees
         result = format_periodic_update("Test-Perp", connected_perp_state)
         assert result is not None
@@ -126,9 +122,7 @@ class TestFormatPeriodicUpdate:
         assert "37.20" in result
 
     def test_no_new_trades_shows_zero(self, connected_spot_state: BotState) -> None:
-        connected_spot_state.prev_roundtrips = 12
-        connected_spot_state.prev_matched_profit = 45.23
-        connected_spot_state.prev_total_fees = 3.12
+        connected_spot_state.prev_snapshot = (12, 45.23, 3.12)
         result = format_periodic_update("Test", connected_spot_state)
         assert result is not None
         assert "+0" in result
@@ -144,6 +138,25 @@ class TestFormatPeriodicUpdate:
         result = format_periodic_update("Test", state)
         assert result is None
 
+    def test_template_reused_across_ticks(self, connected_spot_state: BotState) -> None:
+        format_periodic_update("Test", connected_spot_state)
+        template = connected_spot_state.report_template
+        assert template is not None
+        format_periodic_update("Test", connected_spot_state)
+        assert connected_spot_state.report_template is template
+
+    def test_template_rebuilt_on_leverage_change(self, connected_perp_state: BotState) -> None:
+        format_periodic_update("Test", connected_perp_state)
+        connected_perp_state.summary.leverage = 10  # type: ignore[union-attr]
+        result = format_periodic_update("Test", connected_perp_state)
+        assert result is not None
+        assert "10x" in result
+
+    def test_braces_in_label_are_literal(self, connected_spot_state: BotState) -> None:
+        result = format_periodic_update("Bot{1}", connected_spot_state)
+        assert result is not None
+        assert "Bot{1}" in result
+
 
 class TestFormatErrorAlert:
     def test_error_format(self) -> None:
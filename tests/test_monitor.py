@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -76,6 +78,24 @@ class TestEventHandling:
         assert monitor.bots["TestBot"].config.type == "spot_grid"
         assert monitor.bots["TestBot"].config.total_investment == 1000.0
 
+    @pytest.mark.asyncio
+    async def test_unchanged_info_and_config_kept(self, monitor: Monitor) -> None:
+        info = {"network": "mainnet", "exchange": "hyperliquid"}
+        config = {"type": "spot_grid", "symbol": "ETH/USDC", "total_investment": 1000}
+        await monitor._handle_event("TestBot", "info", info)
+        await monitor._handle_event("TestBot", "config", config)
+        cached_info = monitor.bots["TestBot"].info
+        cached_config = monitor.bots["TestBot"].config
+
+        await monitor._handle_event("TestBot", "info", dict(info))
+        await monitor._handle_event("TestBot", "config", dict(config))
+        assert monitor.bots["TestBot"].info is cached_info
+        assert monitor.bots["TestBot"].config is cached_config
+
+        await monitor._handle_event("TestBot", "config", {**config, "total_investment": 2000})
+        assert monitor.bots["TestBot"].config is not cached_config
+        assert monitor.bots["TestBot"].config.total_investment == 2000.0
+
     @pytest.mark.asyncio
     async def test_spot_grid_summary(self, monitor: Monitor) -> None:
         data = {
@@ -148,6 +168,7 @@ class TestEventHandling:
         await monitor._handle_connect("TestBot")
         assert monitor.bots["TestBot"].connected is True
         assert monitor.bots["TestBot"].last_connected_at is not None
+        assert monitor.bots["TestBot"].last_connected_at_iso is not None
 
         await monitor._handle_disconnect("TestBot")
         assert monitor.bots["TestBot"].connected is False
@@ -223,9 +244,7 @@ class TestInitialSummary:
             "grid_spacing_pct": [1.0, 1.0], "roundtrips": 7,
             "base_balance": 1.0, "quote_balance": 200.0,
         })
-        assert state.prev_roundtrips == 7
-        assert state.prev_matched_profit == 10.0
-        assert state.prev_total_fees == 1.5
+        assert state.prev_snapshot == (7, 10.0, 1.5)
 
 
 class TestErrorCooldown:
@@ -262,3 +281,236 @@ class TestErrorCooldown:
         monitor._error_cooldowns["TestBot"] = datetime.now() - timedelta(seconds=120)
         await monitor._maybe_send_error_alert("TestBot", "err")
         telegram.send_error_alert.assert_called_once()
+
+
+class TestRun:
+    """Test client fan-out in Monitor.run."""
+
+    @pytest.mark.asyncio
+    async def test_starts_one_client_per_bot(self) -> None:
+        config = _make_config(bots=[
+            {"label": "A", "url": "ws://localhost:9000"},
+            {"label": "B", "url": "ws://localhost:9001"},
+        ])
+        monitor = Monitor(config, _make_telegram_mock())
+
+        with patch("src.monitor.BotWebSocketClient") as client_cls:
+            client_cls.return_value.run = AsyncMock()
+            await monitor.run()
+
+        assert set(monitor.bots) == {"A", "B"}
+        assert client_cls.call_count == 2
+        assert client_cls.return_value.run.await_count == 2
+        # Clients report events under the state's interned label object
+        label = client_cls.call_args.kwargs["label"]
+        assert label is monitor.bots["B"].label
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_and_joins_child_tasks(self) -> None:
+        config = _make_config(periodic_minutes=60)
+        monitor = Monitor(config, _make_telegram_mock())
+
+        with patch("src.monitor.BotWebSocketClient") as client_cls:
+            client_cls.return_value.run = AsyncMock(side_effect=asyncio.Event().wait)
+            client_cls.return_value.stop = AsyncMock()
+            run_task = asyncio.create_task(monitor.run())
+            await asyncio.sleep(0)
+            assert len(monitor.tasks) == 2  # one client + reporter
+            await monitor.stop(timeout=1.0)
+            await run_task
+
+        assert all(task.done() for task in monitor.tasks)
+        client_cls.return_value.stop.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stop_abandons_child_that_ignores_cancel(self) -> None:
+        monitor = Monitor(_make_config(), _make_telegram_mock())
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def stubborn() -> None:
+            started.set()
+            while not release.is_set():
+                try:
+                    await release.wait()
+                except asyncio.CancelledError:
+                    pass  # swallows every cancel until released
+
+        with patch("src.monitor.BotWebSocketClient") as client_cls:
+            client_cls.return_value.run = AsyncMock(side_effect=stubborn)
+            client_cls.return_value.stop = AsyncMock()
+            run_task = asyncio.create_task(monitor.run())
+            await started.wait()
+            await asyncio.wait_for(monitor.stop(timeout=0.05), 1.0)
+            await asyncio.wait_for(run_task, 1.0)
+
+        assert not monitor.tasks[0].done()
+        release.set()
+        await monitor.tasks[0]
+
+    @pytest.mark.asyncio
+    async def test_cancelling_run_joins_children(self) -> None:
+        config = _make_config(periodic_minutes=60)
+        monitor = Monitor(config, _make_telegram_mock())
+
+        with patch("src.monitor.BotWebSocketClient") as client_cls:
+            client_cls.return_value.run = AsyncMock(side_effect=asyncio.Event().wait)
+            run_task = asyncio.create_task(monitor.run())
+            await asyncio.sleep(0)
+            run_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run_task
+
+        assert [t.get_name() for t in monitor.tasks] == ["ws-TestBot", "reporter"]
+        assert all(task.cancelled() for task in monitor.tasks)
+
+
+class TestDirtyTracking:
+    """Test that periodic snapshots only touch bots with new summaries."""
+
+    @pytest.mark.asyncio
+    async def test_summary_marks_bot_dirty(self) -> None:
+        monitor = Monitor(_make_config(), _make_telegram_mock())
+        monitor.bots["TestBot"] = BotState(label="TestBot", url="ws://x")
+
+        await monitor._handle_event("TestBot", "spot_grid_summary", {
+            "symbol": "ETH", "state": "Running", "uptime": "1h",
+            "position_size": 1.0, "matched_profit": 10.0,
+            "total_profit": 12.0, "total_fees": 1.0, "grid_count": 5,
+            "grid_range_low": 3000.0, "grid_range_high": 4000.0,
+            "grid_spacing_pct": [1.0, 1.0], "roundtrips": 4,
+            "base_balance": 1.0, "quote_balance": 200.0,
+        })
+        assert monitor._dirty == {"TestBot"}
+
+        monitor._snapshot_dirty()
+        assert monitor._dirty == set()
+        assert monitor.bots["TestBot"].prev_snapshot == (4, 10.0, 1.0)
+
+    def test_clean_bot_not_snapshotted(self, spot_summary: SpotGridSummary) -> None:
+        monitor = Monitor(_make_config(), _make_telegram_mock())
+        state = BotState(label="TestBot", url="ws://x", summary=spot_summary)
+        monitor.bots["TestBot"] = state
+
+        monitor._snapshot_dirty()
+        assert state.prev_snapshot == (0, 0.0, 0.0)
+
+
+class TestLifecycle:
+    """Test generated -> activated -> merged -> archived transitions."""
+
+    def _monitor(self, archive_after: int = 0) -> Monitor:
+        config = _make_config()
+        config.reporting.archive_after_minutes = archive_after
+        return Monitor(config, _make_telegram_mock())
+
+    @pytest.mark.asyncio
+    async def test_summary_activates(self) -> None:
+        monitor = self._monitor()
+        state = BotState(label="TestBot", url="ws://x")
+        monitor.bots["TestBot"] = state
+        assert state.lifecycle == "generated"
+
+        await monitor._handle_event("TestBot", "perp_grid_summary", {
+            "symbol": "HYPE", "state": "Running", "uptime": "1h",
+            "position_size": 50.0, "position_side": "Long",
+            "matched_profit": 20.0, "total_profit": 25.0, "total_fees": 2.0,
+            "leverage": 5, "grid_bias": "long", "grid_count": 10,
+            "grid_range_low": 20.0, "grid_range_high": 30.0,
+            "grid_spacing_pct": [0.5, 0.5], "roundtrips": 5,
+            "margin_balance": 500.0,
+        })
+        assert state.lifecycle == "activated"
+
+    def test_unchanged_bot_merged(self) -> None:
+        monitor = self._monitor()
+        state = BotState(label="TestBot", url="ws://x", lifecycle="activated")
+        monitor.bots["TestBot"] = state
+
+        monitor._update_lifecycles()
+        assert state.lifecycle == "merged"
+
+    def test_dirty_bot_stays_activated(self) -> None:
+        monitor = self._monitor()
+        state = BotState(label="TestBot", url="ws://x", lifecycle="activated")
+        monitor.bots["TestBot"] = state
+        monitor._dirty.add("TestBot")
+
+        monitor._update_lifecycles()
+        assert state.lifecycle == "activated"
+
+    def test_silent_bot_archived(self) -> None:
+        monitor = self._monitor(archive_after=30)
+        state = BotState(
+            label="TestBot", url="ws://x", lifecycle="merged",
+            last_summary_at=time.monotonic() - 31 * 60,
+        )
+        monitor.bots["TestBot"] = state
+
+        monitor._update_lifecycles()
+        assert state.lifecycle == "archived"
+
+    def test_archive_disabled_by_default(self) -> None:
+        monitor = self._monitor()
+        state = BotState(
+            label="TestBot", url="ws://x", lifecycle="merged",
+            last_summary_at=time.monotonic() - 24 * 3600,
+        )
+        monitor.bots["TestBot"] = state
+
+        monitor._update_lifecycles()
+        assert state.lifecycle == "merged"
+
+
+class TestReloadBots:
+    """Test applying a new bot list without restarting."""
+
+    @pytest.mark.asyncio
+    async def test_adds_and_removes_only_the_delta(self) -> None:
+        config = _make_config(bots=[
+            {"label": "Keep", "url": "ws://localhost:9000"},
+            {"label": "Drop", "url": "ws://localhost:9001"},
+        ])
+        monitor = Monitor(config, _make_telegram_mock())
+
+        with patch("src.monitor.BotWebSocketClient") as client_cls:
+            client_cls.return_value.run = AsyncMock(side_effect=asyncio.Event().wait)
+            client_cls.return_value.stop = AsyncMock()
+            run_task = asyncio.create_task(monitor.run())
+            await asyncio.sleep(0)
+            kept_state = monitor.bots["Keep"]
+            kept_task = monitor._client_tasks["Keep"]
+            drop_task = monitor._client_tasks["Drop"]
+
+            await monitor.reload_bots([
+                BotEndpoint(label="Keep", url="ws://localhost:9000"),
+                BotEndpoint(label="New", url="ws://localhost:9002"),
+            ])
+
+            assert set(monitor.bots) == {"Keep", "New"}
+            assert monitor.bots["Keep"] is kept_state
+            assert monitor._client_tasks["Keep"] is kept_task
+            assert drop_task.cancelled()
+            assert drop_task not in monitor.tasks
+            assert client_cls.call_count == 3
+
+            await monitor.stop(timeout=1.0)
+            await run_task
+
+    @pytest.mark.asyncio
+    async def test_changed_url_restarts_bot(self) -> None:
+        monitor = Monitor(_make_config(), _make_telegram_mock())
+
+        with patch("src.monitor.BotWebSocketClient") as client_cls:
+            client_cls.return_value.run = AsyncMock(side_effect=asyncio.Event().wait)
+            client_cls.return_value.stop = AsyncMock()
+            run_task = asyncio.create_task(monitor.run())
+            await asyncio.sleep(0)
+            old_state = monitor.bots["TestBot"]
+
+            await monitor.reload_bots([BotEndpoint(label="TestBot", url="ws://other:9000")])
+
+            assert monitor.bots["TestBot"] is not old_state
+            assert monitor.bots["TestBot"].url == "ws://other:9000"
+
+            await monitor.stop(timeout=1.0)
+            await run_task
@@ -0,0 +1,166 @@
+"""Tests for TelegramBot outbound buffering and rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.bot_state import BotState
+from src.card_renderer import CardSnapshot
+from src.config import TelegramConfig
+from src.telegram_bot import MAX_MESSAGE_LENGTH, TelegramBot, _TokenBucket
+
+
+def _make_bot() -> TelegramBot:
+    bot = TelegramBot(TelegramConfig(bot_token="123:abc", chat_id="42"))
+    bot._send_safe = AsyncMock()  # type: ignore[method-assign]
+    return bot
+
+
+class TestOutboundBuffer:
+    """Test that queued text is coalesced into as few messages as possible."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_does_not_send_immediately(self) -> None:
+        bot = _make_bot()
+        await bot.enqueue("hello")
+        bot._send_safe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_flush_merges_pending_messages(self) -> None:
+        bot = _make_bot()
+        await bot.enqueue("first")
+        await bot.enqueue("second")
+        await bot.flush()
+        bot._send_safe.assert_called_once_with(42, "first\n\nsecond")
+
+    @pytest.mark.asyncio
+    async def test_flush_empty_is_noop(self) -> None:
+        bot = _make_bot()
+        await bot.flush()
+        bot._send_safe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_flushes_early(self) -> None:
+        bot = _make_bot()
+        await bot.enqueue("x" * (MAX_MESSAGE_LENGTH // 2))
+        bot._send_safe.assert_not_called()
+        await bot.enqueue("y" * (MAX_MESSAGE_LENGTH // 2))
+        bot._send_safe.assert_called_once()
+
+
+class TestTokenBucket:
+    """Test the send rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_rate_is_immediate(self) -> None:
+        bucket = _TokenBucket(5)
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_over_rate_waits_for_refill(self) -> None:
+        bucket = _TokenBucket(20)
+        for _ in range(20):
+            await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+
+class TestErrorAlert:
+    """Test that error alerts skip the batch buffer."""
+
+    @pytest.mark.asyncio
+    async def test_alert_sent_immediately_as_own_message(self) -> None:
+        bot = _make_bot()
+        await bot.enqueue("routine update")
+        await bot.send_error_alert("Bot1", "boom")
+
+        assert bot._send_safe.await_count == 2
+        first, second = (c.args for c in bot._send_safe.await_args_list)
+        assert first == (42, "routine update")
+        assert "boom" in second[1] and "routine update" not in second[1]
+        assert bot._pending == []
+
+
+class TestStatusCommand:
+    """Test the /status command handler."""
+
+    @pytest.mark.asyncio
+    async def test_reload_during_status_does_not_break_iteration(self) -> None:
+        bot = _make_bot()
+        states = {
+            "A": BotState(label="A", url="ws://a"),
+            "B": BotState(label="B", url="ws://b"),
+        }
+        monitor = MagicMock()
+        monitor.get_all_states.return_value = states
+        bot.set_monitor(monitor)
+        sent = []
+
+        async def send_card(chat_id, label, state):
+            sent.append(label)
+            if label == "A":  # SIGHUP reload lands mid-loop
+                states["C"] = BotState(label="C", url="ws://c")
+                del states["B"]
+
+        bot._send_status_card = send_card  # type: ignore[method-assign]
+        update = MagicMock()
+        update.message.chat_id = 42
+        context = MagicMock(args=[])
+
+        await bot._cmd_status(update, context)
+
+        assert sent == ["A", "B"]
+
+
+class TestCardRendering:
+    """Test that card rendering stays off the event loop thread."""
+
+    @pytest.mark.asyncio
+    async def test_periodic_card_rendered_in_worker_thread(
+        self, connected_spot_state: BotState
+    ) -> None:
+        bot = _make_bot()
+        bot._send_photo = AsyncMock()  # type: ignore[method-assign]
+        render_threads = []
+
+        def fake_render(label, state, theme):
+            render_threads.append(threading.current_thread())
+            assert isinstance(state, CardSnapshot)  # never the live BotState
+            return io.BytesIO(b"png")
+
+        with patch("src.telegram_bot.build_periodic_card", side_effect=fake_render):
+            await bot._send_periodic_card("Test", connected_spot_state)
+
+        assert render_threads and render_threads[0] is not threading.current_thread()
+        bot._send_photo.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_start_warms_card_caches_in_worker_thread(self) -> None:
+        bot = _make_bot()
+        bot._app = MagicMock()
+        bot._app.initialize = AsyncMock()
+        bot._app.start = AsyncMock()
+        bot._app.updater.start_polling = AsyncMock()
+        warm_threads = []
+
+        with patch(
+            "src.telegram_bot.warm_up",
+            side_effect=lambda theme: warm_threads.append(threading.current_thread()),
+        ):
+            await bot.start()
+        assert bot._flush_task is not None
+        bot._flush_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await bot._flush_task
+
+        assert warm_threads and warm_threads[0] is not threading.current_thread()
@@ -0,0 +1,134 @@
+"""Tests for WebSocket client event queueing, coalescing and backoff."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.config import ConnectionConfig
+from src.ws_client import BotWebSocketClient, coalesce_events
+
+
+def _make_client(on_event: AsyncMock) -> BotWebSocketClient:
+    return BotWebSocketClient(
+        label="TestBot",
+        url="ws://localhost:9000",
+        on_event=on_event,
+        on_connect=AsyncMock(),
+        on_disconnect=AsyncMock(),
+        connection_config=ConnectionConfig(),
+    )
+
+
+class TestCoalesceEvents:
+    def test_keeps_only_latest_summary(self) -> None:
+        events = [
+            ("spot_grid_summary", {"n": 1}),
+            ("spot_grid_summary", {"n": 2}),
+            ("spot_grid_summary", {"n": 3}),
+        ]
+        assert coalesce_events(events) == [("spot_grid_summary", {"n": 3})]
+
+    def test_other_events_kept_in_order(self) -> None:
+        events = [
+            ("info", {"network": "mainnet"}),
+            ("perp_grid_summary", {"n": 1}),
+            ("error", "boom"),
+            ("perp_grid_summary", {"n": 2}),
+            ("error", "bang"),
+        ]
+        assert coalesce_events(events) == [
+            ("info", {"network": "mainnet"}),
+            ("error", "boom"),
+            ("perp_grid_summary", {"n": 2}),
+            ("error", "bang"),
+        ]
+
+    def test_empty(self) -> None:
+        assert coalesce_events([]) == []
+
+
+class TestConsume:
+    @pytest.mark.asyncio
+    async def test_drains_batch_until_sentinel(self) -> None:
+        on_event = AsyncMock()
+        client = _make_client(on_event)
+        queue: asyncio.Queue = asyncio.Queue()
+        for n in range(3):
+            queue.put_nowait(("spot_grid_summary", {"n": n}))
+        queue.put_nowait(("error", "boom"))
+        queue.put_nowait(None)
+
+        await client._consume(queue)
+
+        assert [c.args for c in on_event.await_args_list] == [
+            ("TestBot", "spot_grid_summary", {"n": 2}),
+            ("TestBot", "error", "boom"),
+        ]
+
+
+class _EndlessWS:
+    """Fake socket that yields the same summary message forever."""
+
+    def __aiter__(self) -> _EndlessWS:
+        return self
+
+    async def __anext__(self) -> str:
+        await asyncio.sleep(0)
+        return '{"event_type": "spot_grid_summary", "data": {"n": 1}}'
+
+
+class _ClosingWS:
+    """Fake socket that yields messages, then fails like a dropped connection."""
+
+    def __init__(self, messages: list[str]) -> None:
+        self._messages = iter(messages)
+
+    def __aiter__(self) -> _ClosingWS:
+        return self
+
+    async def __anext__(self) -> str:
+        for message in self._messages:
+            return message
+        raise ConnectionError("connection dropped")
+
+
+class TestPump:
+    @pytest.mark.asyncio
+    async def test_consumer_error_stops_receiver_and_is_raised(self) -> None:
+        client = _make_client(AsyncMock(side_effect=RuntimeError("handler bug")))
+
+        with pytest.raises(RuntimeError, match="handler bug"):
+            await asyncio.wait_for(client._pump(_EndlessWS()), 1.0)
+
+    @pytest.mark.asyncio
+    async def test_backlog_dispatched_before_receiver_error(self) -> None:
+        on_event = AsyncMock()
+        client = _make_client(on_event)
+        ws = _ClosingWS(['{"event_type": "error", "data": "boom"}'])
+
+        with pytest.raises(ConnectionError, match="dropped"):
+            await asyncio.wait_for(client._pump(ws), 1.0)
+
+        on_event.assert_awaited_once_with("TestBot", "error", "boom")
+
+
+class TestBackoff:
+    def test_exponential_capped_with_jitter(self) -> None:
+        client = _make_client(AsyncMock())
+        client._config = ConnectionConfig(
+            reconnect_delay_seconds=5,
+            max_reconnect_delay_seconds=60,
+            reconnect_jitter_seconds=2.0,
+        )
+        for attempt, base in [(0, 5), (1, 10), (2, 20), (3, 40), (4, 60), (10, 60)]:
+            client._attempt = attempt
+            delay = client._backoff()
+            assert base <= delay <= base + 2.0
+
+    def test_no_jitter_when_disabled(self) -> None:
+        client = _make_client(AsyncMock())
+        client._config = ConnectionConfig(reconnect_jitter_seconds=0)
+        assert client._backoff() == 5